@@ -58,8 +58,7 @@ class IntervalAction(Action):
 
 class InstantAction(IntervalAction):
     def __init__(self):
-        super().__init__()
-        self.duration = 0.0
+        super().__init__(0.0)
 
     def step(self, dt: float):
         pass
@@ -67,6 +66,11 @@ class InstantAction(IntervalAction):
     def start(self):
         self._done = True
 
+    def done(self) -> bool:
+        # Over once started, even for subclasses whose start() doesn't call
+        # this one.
+        return True
+
     def update(self, t: float):
         pass
 
@@ -198,7 +202,8 @@ class Repeat(Action):
         super().stop()
 
 
-# Integrate with Arcade Sprite
+# Integrate with Arcade Sprite. Each sprite steps its own actions; with many
+# sprites, an ActionManager (actions/manager.py) steps them all in one pass.
 class ActionSprite(arcade.Sprite):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -209,10 +214,10 @@ class ActionSprite(arcade.Sprite):
         action.start()
         self.actions.append(action)
 
-    def update(self):
-        super().update()
+    def update(self, delta_time: float = 1 / 60, *args, **kwargs):
+        super().update(delta_time, *args, **kwargs)
         for action in self.actions[:]:
-            action.step(1 / 60)  # Assuming 60 FPS, adjust as needed
+            action.step(delta_time)
             if action.done():
                 action.stop()
                 self.actions.remove(action)
@@ -0,0 +1,220 @@
+from collections.abc import Callable
+from typing import Any, Optional
+
+import numpy as np
+
+from .base import Action
+from .curves import Easing, Path, accel_decel, power
+from .interval import (
+    AccelDecel,
+    Accelerate,
+    Bezier,
+    Ease,
+    FadeTo,
+    FollowPath,
+    Lerp,
+    MoveBy,
+    MoveTo,
+    RotateBy,
+    RotateTo,
+    ScaleBy,
+    ScaleTo,
+    Speed,
+)
+
+# What each batchable action writes, where it started and how far it goes,
+# read from the action once it has started. Only these exact types are
+# batched: a subclass may have changed what update() does.
+_TWEENS: dict[type, Callable[[Any], tuple[str, Any, Any]]] = {
+    MoveTo: lambda action: ("position", action.start_position, action.delta),
+    MoveBy: lambda action: ("position", action.start_position, action.delta),
+    Lerp: lambda action: (action.attrib, action.start_value, action.delta),
+    RotateBy: lambda action: ("angle", action.start_angle, action.angle),
+    RotateTo: lambda action: ("angle", action.start_angle, action.angle),
+    FadeTo: lambda action: ("alpha", action.start_alpha, action.end_alpha - action.start_alpha),
+    ScaleTo: lambda action: ("scale", action.start_scale, action.end_scale - action.start_scale),
+    ScaleBy: lambda action: ("scale", action.start_scale, action.end_scale - action.start_scale),
+    # The path's points are added to the start instead of a delta times t.
+    FollowPath: lambda action: ("position", action.start_position, action.path),
+    Bezier: lambda action: ("position", action.start_position, action.path),
+}
+_WRAPS_AT_360 = {RotateBy, RotateTo}
+_TRUNCATES = {FadeTo}
+
+
+def _easing(action: Action) -> tuple[Action, tuple[Easing, ...]]:
+    # Unwrap the easing actions around a tween, outermost first. Speed only
+    # changes the duration, which the outermost action already has.
+    easing = []
+    while True:
+        kind = type(action)
+        if kind is Accelerate:
+            easing.append(power(action.rate))
+        elif kind is AccelDecel:
+            easing.append(accel_decel)
+        elif kind is Ease:
+            easing.append(action.easing)
+        elif kind is not Speed:
+            return action, tuple(easing)
+        action = action.other
+
+
+class _TweenGroup:
+    # The running tweens of one type, attribute and easing, a row each; for
+    # actions that follow a path, of one path too.
+
+    def __init__(self, kind: type, attribute: str, easing: tuple, width: int, path: Optional[Path] = None):
+        self.attribute = attribute
+        self.easing = easing
+        self.path = path
+        self.wraps = kind in _WRAPS_AT_360
+        self.truncates = kind in _TRUNCATES
+        self.actions: list[Action] = []
+        self.targets: list[Any] = []
+        self.rows: dict[Action, int] = {}
+        capacity = 16
+        self.start = np.zeros((capacity, width))
+        self.delta = np.zeros((capacity, width))
+        self.duration = np.ones(capacity)
+        self.elapsed = np.zeros(capacity)
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def _grow(self):
+        capacity = 2 * len(self.elapsed)
+        for name in ("start", "delta", "duration", "elapsed"):
+            old = getattr(self, name)
+            new = np.zeros((capacity, *old.shape[1:]))
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, action: Action, inner: Action, start, delta):
+        row = len(self.actions)
+        if row == len(self.elapsed):
+            self._grow()
+        self.rows[action] = row
+        self.actions.append(action)
+        self.targets.append(inner.target)
+        self.start[row] = start
+        self.delta[row] = delta
+        self.duration[row] = action.duration
+        self.elapsed[row] = action._elapsed
+
+    def remove(self, action: Action):
+        # The last row moves into the one removed, and the action keeps the
+        # time it had run for, as if it had been stepping on its own.
+        row = self.rows.pop(action)
+        action._elapsed = float(self.elapsed[row])
+        last = len(self.actions) - 1
+        if row != last:
+            moved = self.actions[row] = self.actions[last]
+            self.targets[row] = self.targets[last]
+            self.rows[moved] = row
+            for array in (self.start, self.delta, self.duration, self.elapsed):
+                array[row] = array[last]
+        self.actions.pop()
+        self.targets.pop()
+
+    def step(self, dt: float) -> list[Action]:
+        count = len(self.actions)
+        elapsed = self.elapsed[:count]
+        elapsed += dt
+        # The same arithmetic, in the same order, as IntervalAction.step and
+        # each action's update(t), so the results match to the bit.
+        t = np.minimum(elapsed / self.duration[:count], 1.0)
+        finished = np.flatnonzero(t == 1.0)
+        for easing in self.easing:
+            t = easing.apply(t)
+        if self.path is not None:
+            # Every sprite on the path in one evaluation.
+            values = self.start[:count] + self.path.points(t)
+        else:
+            values = self.start[:count] + self.delta[:count] * t[:, None]
+        if self.wraps:
+            values %= 360
+        if self.truncates:
+            values = values.astype(np.int64)
+
+        attribute = self.attribute
+        if values.shape[1] == 1:
+            for target, value in zip(self.targets, values[:, 0].tolist()):
+                setattr(target, attribute, value)
+        else:
+            for target, value in zip(self.targets, map(tuple, values.tolist())):
+                setattr(target, attribute, value)
+
+        done = []
+        for row in finished[::-1].tolist():  # from the end, so rows stay put
+            action = self.actions[row]
+            self.remove(action)
+            action._done = True
+            done.append(action)
+        return done
+
+
+class TweenBatch:
+    """Steps interval actions that only tween attributes in bulk, with
+    NumPy.
+
+    Running ``MoveTo``, ``MoveBy``, ``Lerp``, ``RotateBy``, ``RotateTo``,
+    ``FadeTo``, ``ScaleTo``, ``ScaleBy``, ``FollowPath`` and ``Bezier``
+    actions, alone or wrapped in ``Speed``, ``Accelerate``, ``AccelDecel``
+    and ``Ease``, are grouped by type, attribute, easing and path. Each group keeps its start values, deltas,
+    durations and elapsed times in arrays, works out every value in one go,
+    then writes them to the targets. :meth:`accepts` tells whether an action
+    can be batched; an ``ActionManager(batched=True)`` uses it to send the
+    ones that can here.
+    """
+
+    def __init__(self):
+        self.groups: dict[tuple, _TweenGroup] = {}
+        self._group_of: dict[Action, _TweenGroup] = {}
+
+    def __len__(self) -> int:
+        return len(self._group_of)
+
+    def __contains__(self, action: Action) -> bool:
+        return action in self._group_of
+
+    @staticmethod
+    def accepts(action: Action) -> bool:
+        if getattr(action, "duration", 0) <= 0:
+            return False
+        inner, _ = _easing(action)
+        return type(inner) in _TWEENS
+
+    def add(self, action: Action):
+        """Step ``action``, which has started and :meth:`accepts`, from now on."""
+        inner, easing = _easing(action)
+        attribute, start, delta = _TWEENS[type(inner)](inner)
+        start = np.atleast_1d(np.asarray(start, float))
+        path = None
+        if isinstance(delta, Path):
+            path = delta
+            delta = np.zeros_like(start)
+        else:
+            delta = np.atleast_1d(np.asarray(delta, float))
+        key = (type(inner), attribute, easing, len(start), path)
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = _TweenGroup(type(inner), attribute, easing, len(start), path)
+        group.add(action, inner, start, delta)
+        self._group_of[action] = group
+
+    def remove(self, action: Action):
+        self._group_of.pop(action).remove(action)
+
+    def step(self, dt: float) -> list[Action]:
+        """Step every action by ``dt``; returns the ones that finished."""
+        finished = []
+        for group in self.groups.values():
+            if group.actions:
+                finished.extend(group.step(dt))
+        for action in finished:
+            del self._group_of[action]
+        return finished
+
+    def clear(self):
+        self.groups.clear()
+        self._group_of.clear()
@@ -0,0 +1,284 @@
+import bisect
+import math
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+
+import numpy as np
+
+ARC_LENGTH_SAMPLES = 32  # per segment, for paths travelled at constant speed
+EASING_TABLE_SIZE = 256
+
+Point = tuple[float, float]
+
+
+def elementwise(function: Callable[[float], float], values: np.ndarray) -> np.ndarray:
+    # NumPy's vectorized exp, power and the like can round differently from
+    # the math module's in the last bit, so those go through Python's, one
+    # by one, wherever an array has to match what a float gets.
+    return np.fromiter(map(function, values.tolist()), float, len(values))
+
+
+class CubicBezier:
+    """One cubic Bézier segment, with its polynomial coefficients worked out
+    up front so each point costs two Horner evaluations."""
+
+    def __init__(self, p0: Point, p1: Point, p2: Point, p3: Point):
+        self.control_points = (p0, p1, p2, p3)
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = self.control_points
+        cx = 3 * (x1 - x0)
+        bx = 3 * (x2 - x1) - cx
+        ax = x3 - x0 - cx - bx
+        cy = 3 * (y1 - y0)
+        by = 3 * (y2 - y1) - cy
+        ay = y3 - y0 - cy - by
+        self.coefficients = (ax, bx, cx, x0, ay, by, cy, y0)
+
+    def point(self, t: float) -> Point:
+        ax, bx, cx, x0, ay, by, cy, y0 = self.coefficients
+        return (((ax * t + bx) * t + cx) * t + x0, ((ay * t + by) * t + cy) * t + y0)
+
+    def reversed(self) -> "CubicBezier":
+        return CubicBezier(*reversed(self.control_points))
+
+
+class Path:
+    """Cubic Bézier segments joined end to end, travelled as ``u`` goes from
+    0 to 1.
+
+    By default each segment takes an equal share of ``u``, and within one
+    the speed follows its control points. With ``constant_speed`` a table of
+    the distance covered at ``samples`` points per segment, built once here,
+    maps ``u`` to the fraction of the path's length instead, so a sprite
+    moves along it at an even pace.
+
+    :meth:`point` remembers its last answer, so sprites flying the same path
+    in formation work it out once per tick between them, and :meth:`points`
+    does a whole array of ``u`` at once, with the same arithmetic.
+    """
+
+    def __init__(self, segments: Sequence[CubicBezier], constant_speed: bool = False, samples=ARC_LENGTH_SAMPLES):
+        if not segments:
+            raise ValueError("a path needs at least one segment")
+        self.segments = list(segments)
+        self.constant_speed = constant_speed
+        self._coefficients = np.array([segment.coefficients for segment in self.segments])
+        self._last_u = None
+        self._last_point = None
+
+        count = len(self.segments) * samples
+        params = [k / count for k in range(count + 1)]
+        xs, ys = zip(*(self._point_at(s) for s in params))
+        distances = np.concatenate(([0.0], np.cumsum(np.hypot(np.diff(xs), np.diff(ys)))))
+        self.length = float(distances[-1])
+        if constant_speed and self.length > 0:
+            lengths = np.minimum(distances / self.length, 1.0)
+            lengths[-1] = 1.0
+            self._params = params
+            self._lengths = lengths.tolist()
+            self._param_array = np.array(params)
+            self._length_array = lengths
+        else:
+            self.constant_speed = False
+
+    @classmethod
+    def bezier(cls, control_points: Sequence[Point], constant_speed: bool = False) -> "Path":
+        """A path from 3n+1 control points, each segment sharing its last
+        point with the next one's first."""
+        if len(control_points) < 4 or (len(control_points) - 1) % 3:
+            raise ValueError("a Bézier path needs 3n+1 control points")
+        return cls(
+            [CubicBezier(*control_points[i : i + 4]) for i in range(0, len(control_points) - 1, 3)],
+            constant_speed,
+        )
+
+    @classmethod
+    def through(cls, points: Sequence[Point], constant_speed: bool = True) -> "Path":
+        """A smooth (Catmull-Rom) path passing through every one of
+        ``points``, such as the waypoints of a long flight path."""
+        if len(points) < 2:
+            raise ValueError("a path needs at least two points")
+        padded = [points[0], *points, points[-1]]
+        segments = []
+        for i in range(1, len(padded) - 2):
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = padded[i - 1 : i + 3]
+            segments.append(
+                CubicBezier(
+                    (x1, y1),
+                    (x1 + (x2 - x0) / 6, y1 + (y2 - y0) / 6),
+                    (x2 - (x3 - x1) / 6, y2 - (y3 - y1) / 6),
+                    (x2, y2),
+                )
+            )
+        return cls(segments, constant_speed)
+
+    def reversed(self) -> "Path":
+        return Path([segment.reversed() for segment in reversed(self.segments)], self.constant_speed)
+
+    def parameter(self, u: float) -> float:
+        """Where along the segments ``u`` of the way along the path is."""
+        if not self.constant_speed:
+            return u
+        lengths = self._lengths
+        k = min(max(bisect.bisect_right(lengths, u) - 1, 0), len(lengths) - 2)
+        l0 = lengths[k]
+        span = lengths[k + 1] - l0
+        s0 = self._params[k]
+        if span <= 0:
+            return s0
+        return s0 + (self._params[k + 1] - s0) * (u - l0) / span
+
+    def _point_at(self, s: float) -> Point:
+        count = len(self.segments)
+        if count == 1:
+            return self.segments[0].point(s)
+        index = int(s * count)
+        if index == count:
+            index -= 1
+        return self.segments[index].point(s * count - index)
+
+    def point(self, u: float) -> Point:
+        if u == self._last_u:
+            return self._last_point
+        point = self._point_at(self.parameter(u))
+        self._last_u = u
+        self._last_point = point
+        return point
+
+    def points(self, u: np.ndarray) -> np.ndarray:
+        """The points at each of ``u``, as rows of an array; the same values
+        :meth:`point` gives."""
+        if self.constant_speed:
+            lengths = self._length_array
+            k = np.clip(np.searchsorted(lengths, u, side="right") - 1, 0, len(lengths) - 2)
+            l0 = lengths[k]
+            span = lengths[k + 1] - l0
+            s0 = self._param_array[k]
+            moving = span > 0
+            s = np.where(moving, s0 + (self._param_array[k + 1] - s0) * (u - l0) / np.where(moving, span, 1.0), s0)
+        else:
+            s = u
+        count = len(self.segments)
+        index = np.minimum((s * count).astype(np.int64), count - 1)
+        t = s * count - index
+        ax, bx, cx, x0, ay, by, cy, y0 = self._coefficients[index].T
+        return np.column_stack((((ax * t + bx) * t + cx) * t + x0, ((ay * t + by) * t + cy) * t + y0))
+
+
+@lru_cache(maxsize=256)
+def bezier_path(control_points: tuple[Point, ...], constant_speed: bool = False) -> Path:
+    """A :class:`Path` shared by every caller with the same control points,
+    so its table and last point are too."""
+    return Path.bezier(control_points, constant_speed)
+
+
+# Easings map the fraction of an action's time gone to the fraction of its
+# change made. Each is called with a float by an action stepping on its own,
+# and given an array by apply() for a batch, with the same results.
+
+
+class Easing:
+    def __call__(self, t: float) -> float:
+        raise NotImplementedError
+
+    def apply(self, t: np.ndarray) -> np.ndarray:
+        return elementwise(self, t)
+
+
+class Power(Easing):
+    """t to the power ``rate``: speeds up for rates over 1, slows down under."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+
+    def __call__(self, t: float) -> float:
+        return t**self.rate
+
+    def apply(self, t: np.ndarray) -> np.ndarray:
+        rate = self.rate
+        return elementwise(lambda value: value**rate, t)
+
+
+class PowerOut(Power):
+    """1 - (1 - t) to the power ``rate``: :class:`Power` played backwards."""
+
+    def __call__(self, t: float) -> float:
+        return 1 - (1 - t) ** self.rate
+
+    def apply(self, t: np.ndarray) -> np.ndarray:
+        rate = self.rate
+        return 1 - elementwise(lambda value: value**rate, 1 - t)
+
+
+class Sigmoid(Easing):
+    """Starts slowly, speeds up through the middle and slows down again; ends
+    exactly at 1, though it starts a touch above 0."""
+
+    def __init__(self, steepness: float = 12):
+        self.steepness = steepness
+
+    def __call__(self, t: float) -> float:
+        if t == 1.0:
+            return t
+        return 1.0 / (1.0 + math.exp(-((t - 0.5) * self.steepness)))
+
+    def apply(self, t: np.ndarray) -> np.ndarray:
+        sigmoid = 1.0 / (1.0 + elementwise(math.exp, -((t - 0.5) * self.steepness)))
+        return np.where(t != 1.0, sigmoid, t)
+
+
+class Smoothstep(Easing):
+    """3t² - 2t³, easing in and out with no table and no transcendental."""
+
+    def __call__(self, t: float) -> float:
+        return t * t * (3 - 2 * t)
+
+    def apply(self, t: np.ndarray) -> np.ndarray:
+        return t * t * (3 - 2 * t)
+
+
+class EasingTable(Easing):
+    """Any easing, sampled ``size`` times once and then looked up with linear
+    interpolation; worth it for easings that are dear to work out, such as
+    :func:`cubic_bezier_easing`."""
+
+    def __init__(self, function: Callable[[float], float], size: int = EASING_TABLE_SIZE):
+        self.size = size
+        self.values = [function(i / size) for i in range(size + 1)]
+        self._value_array = np.array(self.values)
+
+    def __call__(self, t: float) -> float:
+        if t >= 1:
+            return self.values[-1]
+        x = t * self.size
+        i = int(x)
+        low = self.values[i]
+        return low + (self.values[i + 1] - low) * (x - i)
+
+    def apply(self, t: np.ndarray) -> np.ndarray:
+        x = t * self.size
+        i = np.minimum(x.astype(np.int64), self.size - 1)
+        low = self._value_array[i]
+        values = low + (self._value_array[i + 1] - low) * (x - i)
+        return np.where(t >= 1, self._value_array[-1], values)
+
+
+@lru_cache(maxsize=None)
+def power(rate: float) -> Power:
+    return Power(rate)
+
+
+@lru_cache(maxsize=64)
+def cubic_bezier_easing(x1: float, y1: float, x2: float, y2: float) -> EasingTable:
+    """The CSS ``cubic-bezier(x1, y1, x2, y2)`` timing function as a table,
+    made once per set of control points."""
+    curve = CubicBezier((0, 0), (x1, y1), (x2, y2), (1, 1))
+    # Sample densely along the curve, then read y off at evenly spaced x.
+    samples = np.array([curve.point(i / (8 * EASING_TABLE_SIZE)) for i in range(8 * EASING_TABLE_SIZE + 1)])
+    xs = np.maximum.accumulate(samples[:, 0])
+    return EasingTable(lambda t: float(np.interp(t, xs, samples[:, 1])))
+
+
+ease_in = power(2)
+ease_out = PowerOut(2)
+ease_in_out = Smoothstep()
+accel_decel = Sigmoid()
@@ -4,6 +4,7 @@ import random
 import arcade
 
 from .base import IntervalAction
+from .curves import Easing, Path, accel_decel, bezier_path
 
 
 class Lerp(IntervalAction):
@@ -101,15 +102,26 @@ class AccelDecel(IntervalAction):
         self.other.start()
 
     def update(self, t: float):
-        if t != 1.0:
-            ft = (t - 0.5) * 12
-            t = 1.0 / (1.0 + math.exp(-ft))
-        self.other.update(t)
+        self.other.update(accel_decel(t))
 
     def __reversed__(self):
         return AccelDecel(self.other.__reversed__())
 
 
+class Ease(IntervalAction):
+    def __init__(self, other: IntervalAction, easing: Easing):
+        super().__init__(other.duration)
+        self.other = other
+        self.easing = easing
+
+    def start(self):
+        self.other.target = self.target
+        self.other.start()
+
+    def update(self, t: float):
+        self.other.update(self.easing(t))
+
+
 class MoveTo(IntervalAction):
     def __init__(self, position: tuple[float, float], duration: float = 5):
         super().__init__(duration)
@@ -204,34 +216,36 @@ class Blink(IntervalAction):
         return self
 
 
-class Bezier(IntervalAction):
-    def __init__(self, bezier: list[tuple[float, float]], duration: float = 5):
+class FollowPath(IntervalAction):
+    def __init__(self, path: Path, duration: float = 5, relative: bool = True):
         super().__init__(duration)
-        self.bezier = bezier
+        self.path = path
+        self.relative = relative
 
     def start(self):
-        self.start_position = (self.target.center_x, self.target.center_y)
+        if self.relative:
+            self.start_position = (self.target.center_x, self.target.center_y)
+        else:
+            self.start_position = (0.0, 0.0)
 
     def update(self, t: float):
-        p = self._bezier_at(t)
+        p = self.path.point(t)
         self.target.center_x = self.start_position[0] + p[0]
         self.target.center_y = self.start_position[1] + p[1]
 
-    def _bezier_at(self, t: float) -> tuple[float, float]:
-        # Simple implementation for cubic Bezier curve
-        cx = 3 * (self.bezier[1][0] - self.bezier[0][0])
-        bx = 3 * (self.bezier[2][0] - self.bezier[1][0]) - cx
-        ax = self.bezier[3][0] - self.bezier[0][0] - cx - bx
-        cy = 3 * (self.bezier[1][1] - self.bezier[0][1])
-        by = 3 * (self.bezier[2][1] - self.bezier[1][1]) - cy
-        ay = self.bezier[3][1] - self.bezier[0][1] - cy - by
+    def __reversed__(self):
+        return FollowPath(self.path.reversed(), self.duration, self.relative)
+
 
-        x = ax * (t**3) + bx * (t**2) + cx * t + self.bezier[0][0]
-        y = ay * (t**3) + by * (t**2) + cy * t + self.bezier[0][1]
-        return (x, y)
+class Bezier(FollowPath):
+    # 3n+1 control points make n cubic segments. The path is built, and its
+    # coefficients worked out, once for all the Beziers with the same points.
+    def __init__(self, bezier: list[tuple[float, float]], duration: float = 5, constant_speed: bool = False):
+        super().__init__(bezier_path(tuple(map(tuple, bezier)), constant_speed), duration)
+        self.bezier = bezier
 
     def __reversed__(self):
-        return Bezier(list(reversed(self.bezier)), self.duration)
+        return Bezier(list(reversed(self.bezier)), self.duration, self.path.constant_speed)
 
 
 class JumpBy(IntervalAction):
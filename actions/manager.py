@@ -0,0 +1,207 @@
+from collections.abc import Callable
+from typing import Any
+
+import arcade
+
+from .base import Action
+from .batch import TweenBatch
+
+
+class ActionManager:
+    """Runs the actions of every target from one place.
+
+    Running actions sit in the dense ``actions`` list, and :meth:`update`
+    steps them all in one pass with the real frame time, times
+    ``time_scale``. An action that finishes, or is removed, has the last one
+    moved into its slot, so removal is O(1) and each step costs the same
+    however many actions are running. :meth:`pause` takes a target's actions
+    out of that list until :meth:`resume` puts them back.
+
+    Actions may add, remove, pause or resume others while :meth:`update` is
+    running, as a ``CallFunc`` might: a removed action isn't stepped again,
+    and everything else takes effect once the pass is over.
+
+    With ``batched`` the actions a :class:`TweenBatch` accepts run there
+    instead, as arrays stepped in bulk, and ``actions`` holds the rest.
+    """
+
+    def __init__(self, time_scale: float = 1.0, batched: bool = False):
+        self.time_scale = time_scale
+        self.tweens = TweenBatch() if batched else None
+        self.actions: list[Action] = []
+        self._slots: dict[Action, int] = {}
+        # Every action added and not yet finished or removed, running or
+        # paused, by target.
+        self._by_target: dict[Any, dict[Action, None]] = {}
+        self._paused: set[Any] = set()
+        self._updating = False
+        self._deferred: list[tuple[Callable, tuple]] = []
+
+    def __len__(self) -> int:
+        return len(self.actions) + (len(self.tweens) if self.tweens is not None else 0)
+
+    def __contains__(self, action: Action) -> bool:
+        actions = self._by_target.get(action.target)
+        return actions is not None and action in actions
+
+    def _append(self, action: Action):
+        if self.tweens is not None and self.tweens.accepts(action):
+            self.tweens.add(action)
+            return
+        self._slots[action] = len(self.actions)
+        self.actions.append(action)
+
+    def _running(self, action: Action) -> bool:
+        return action in self._slots or (self.tweens is not None and action in self.tweens)
+
+    def _discard(self, action: Action):
+        if action not in self._slots:
+            self.tweens.remove(action)
+            return
+        index = self._slots.pop(action)
+        last = self.actions.pop()
+        if last is not action:
+            self.actions[index] = last
+            self._slots[last] = index
+
+    def _unregister(self, action: Action, target):
+        actions = self._by_target[target]
+        del actions[action]
+        if not actions:
+            del self._by_target[target]
+
+    def add(self, action: Action, target) -> Action:
+        if self._updating:
+            self._deferred.append((self.add, (action, target)))
+            return action
+        if action in self:
+            raise ValueError("the action is already running")
+        action.target = target
+        action.scheduled_to_remove = False
+        action.start()
+        self._by_target.setdefault(target, {})[action] = None
+        if target not in self._paused:
+            self._append(action)
+        return action
+
+    def remove(self, action: Action):
+        if self._updating:
+            action.scheduled_to_remove = True
+            self._deferred.append((self.remove, (action,)))
+            return
+        if action not in self:
+            return
+        if self._running(action):
+            self._discard(action)
+        self._unregister(action, action.target)
+        action.stop()
+
+    def remove_target(self, target):
+        for action in list(self._by_target.get(target, ())):
+            self.remove(action)
+
+    def actions_of(self, target) -> list[Action]:
+        return list(self._by_target.get(target, ()))
+
+    def pause(self, target):
+        if self._updating:
+            self._deferred.append((self.pause, (target,)))
+            return
+        self._paused.add(target)
+        for action in self._by_target.get(target, ()):
+            if self._running(action):
+                self._discard(action)
+
+    def resume(self, target):
+        if self._updating:
+            self._deferred.append((self.resume, (target,)))
+            return
+        self._paused.discard(target)
+        for action in self._by_target.get(target, ()):
+            if not self._running(action):
+                self._append(action)
+
+    def is_paused(self, target) -> bool:
+        return target in self._paused
+
+    def update(self, delta_time: float):
+        dt = delta_time * self.time_scale
+        actions = self.actions
+        self._updating = True
+        try:
+            if self.tweens is not None:
+                # First, so that a tween removed by another action this pass
+                # has already had its last step.
+                for action in self.tweens.step(dt):
+                    target = action.target
+                    self._unregister(action, target)
+                    action.stop()
+            # Walk backwards: a finished action has the last one, which has
+            # already been stepped, swapped into its place.
+            index = len(actions)
+            while index:
+                index -= 1
+                action = actions[index]
+                if action.scheduled_to_remove:
+                    continue
+                action.step(dt)
+                if action.done():
+                    target = action.target
+                    self._discard(action)
+                    self._unregister(action, target)
+                    action.stop()
+        finally:
+            self._updating = False
+        if self._deferred:
+            deferred = self._deferred
+            self._deferred = []
+            for method, args in deferred:
+                method(*args)
+
+    def clear(self):
+        for action in self.actions:
+            action.stop()
+        self.actions.clear()
+        self._slots.clear()
+        if self.tweens is not None:
+            self.tweens.clear()
+        self._by_target.clear()
+        self._paused.clear()
+        self._deferred.clear()
+
+
+# Usage example
+if __name__ == "__main__":
+    from .interval import MoveBy, RotateBy
+
+    window = arcade.Window(800, 600, "Action Manager Example")
+    manager = ActionManager()
+    sprites = arcade.SpriteList()
+
+    for i in range(100):
+        sprite = arcade.Sprite(":resources:images/enemies/bee.png", 0.3)
+        sprite.center_x = 50 + (i % 10) * 70
+        sprite.center_y = 100 + (i // 10) * 45
+        sprites.append(sprite)
+        manager.add((MoveBy((0, 40), 1.0) + MoveBy((0, -40), 1.0)) * 5 | RotateBy(360, 10.0), sprite)
+
+    @window.event
+    def on_draw():
+        window.clear()
+        sprites.draw()
+
+    @window.event
+    def on_key_press(key, modifiers):
+        # Space pauses the bottom row, and the number keys change the speed.
+        if key == arcade.key.SPACE:
+            for sprite in sprites[:10]:
+                if manager.is_paused(sprite):
+                    manager.resume(sprite)
+                else:
+                    manager.pause(sprite)
+        elif arcade.key.KEY_1 <= key <= arcade.key.KEY_4:
+            manager.time_scale = 0.5 * (key - arcade.key.KEY_0)
+
+    arcade.schedule(manager.update, 1 / 60)
+
+    arcade.run()
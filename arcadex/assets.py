@@ -0,0 +1,257 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+import arcade
+
+from arcadex.atlas import SpriteAtlas, grid_frame_name
+
+
+class AssetRecord(NamedTuple):
+    kind: str
+    name: str
+    load_time: float  # seconds spent loading and decoding
+    size: int  # bytes of decoded pixels or samples
+    requests: int
+
+
+class Preload:
+    """A batch of assets being loaded by :meth:`AssetCache.preload`.
+
+    Poll :attr:`progress` or :meth:`ready` from the main loop to draw a
+    loading screen and start as soon as what's needed has arrived. A load
+    that failed raises its error from :meth:`wait`, or from whichever cache
+    call asks for that asset.
+    """
+
+    def __init__(self, cache, futures):
+        self._cache = cache
+        self._futures = futures
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    @property
+    def loaded(self) -> int:
+        return sum(future.done() for future in self._futures.values())
+
+    @property
+    def progress(self) -> float:
+        if not self._futures:
+            return 1.0
+        return self.loaded / len(self._futures)
+
+    @property
+    def done(self) -> bool:
+        return all(future.done() for future in self._futures.values())
+
+    def ready(self, manifest) -> bool:
+        """Whether every asset in ``manifest`` has finished loading."""
+        for entry in manifest:
+            future = self._futures.get(self._cache._spec(*entry)[0])
+            if future is not None and not future.done():
+                return False
+        return True
+
+    def wait(self):
+        for future in self._futures.values():
+            future.result()
+
+
+class AssetCache:
+    """Loads each texture, spritesheet grid and sound once and hands out the
+    same object to everyone who asks for it again.
+
+    Every load is timed and sized, so :meth:`report` shows what the process
+    spent on assets. Use the shared ``assets`` instance unless a separate
+    cache is really wanted.
+
+    :meth:`preload` decodes a manifest of assets on worker threads. Asking for
+    an asset that's still loading waits for that load instead of starting
+    another. Only decoding happens off the main thread: textures reach the
+    GPU when a SpriteList first draws them.
+
+    With :meth:`use_atlas`, textures and grid cells found in a prebuilt
+    :class:`~arcadex.atlas.SpriteAtlas` come from it instead of their files.
+    """
+
+    def __init__(self):
+        self._assets = {}
+        self._records = {}
+        self._requests = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._atlas_path = None
+        self._atlas_lock = threading.Lock()
+
+    def use_atlas(self, path):
+        """Take textures from the atlas at ``path``, read on first use. Does
+        nothing if there's no such file."""
+        path = Path(path)
+        self._atlas_path = path if path.exists() else None
+
+    def _atlas(self):
+        if self._atlas_path is None:
+            return None
+        # Held while the atlas loads, so worker threads read it only once.
+        with self._atlas_lock:
+            return self._get(self._atlas_spec(self._atlas_path))
+
+    def _atlas_spec(self, path):
+        return (
+            ("atlas", path),
+            "atlas",
+            str(path),
+            lambda: SpriteAtlas.load(path),
+            lambda atlas: atlas.size[0] * atlas.size[1] * 4,
+        )
+
+    def _spec(self, kind, *args):
+        # A manifest entry is the kind followed by that method's arguments.
+        return getattr(self, f"_{kind}_spec")(*args)
+
+    def _texture_spec(self, path):
+        def load():
+            atlas = self._atlas()
+            if atlas is not None and path in atlas:
+                return atlas.texture(path)
+            return arcade.load_texture(path)
+
+        return (
+            ("texture", path),
+            "texture",
+            str(path),
+            load,
+            _texture_size,
+        )
+
+    def _grid_spec(self, path, size, columns, count):
+        def load():
+            atlas = self._atlas()
+            names = [grid_frame_name(path, size, columns, i) for i in range(count)]
+            if atlas is not None and all(name in atlas for name in names):
+                return [atlas.texture(name) for name in names]
+            spritesheet = arcade.load_spritesheet(path)
+            return spritesheet.get_texture_grid(size=size, columns=columns, count=count)
+
+        return (
+            ("grid", path, tuple(size), columns, count),
+            "grid",
+            f"{path} [{count}]",
+            load,
+            lambda textures: sum(map(_texture_size, textures)),
+        )
+
+    def _sound_spec(self, path):
+        return (
+            ("sound", path),
+            "sound",
+            str(path),
+            lambda: arcade.load_sound(path),
+            _sound_size,
+        )
+
+    def _load(self, key, kind, name, load, measure, requests=0):
+        start = time.perf_counter()
+        asset = load()
+        load_time = time.perf_counter() - start
+        record = (kind, name, load_time, measure(asset))
+        with self._lock:
+            self._assets[key] = asset
+            self._records[key] = record
+            self._requests[key] = requests
+            self._pending.pop(key, None)
+        return asset
+
+    def _get(self, spec):
+        key = spec[0]
+        with self._lock:
+            asset = self._assets.get(key)
+            if asset is not None:
+                self._requests[key] += 1
+                return asset
+            future = self._pending.get(key)
+        if future is None:
+            return self._load(*spec, requests=1)
+        asset = future.result()
+        with self._lock:
+            self._requests[key] += 1
+        return asset
+
+    def texture(self, path) -> arcade.Texture:
+        return self._get(self._texture_spec(path))
+
+    def texture_grid(self, path, size, columns, count) -> list[arcade.Texture]:
+        """The first ``count`` cells of ``size`` pixels from the spritesheet at
+        ``path``, read ``columns`` to a row."""
+        return self._get(self._grid_spec(path, size, columns, count))
+
+    def sound(self, path) -> arcade.Sound:
+        return self._get(self._sound_spec(path))
+
+    def preload(self, manifest, workers=None) -> Preload:
+        """Start loading every asset in ``manifest`` on a pool of ``workers``
+        threads and return at once.
+
+        Each entry is a method's name and its arguments, such as
+        ``("texture", path)`` or ``("grid", path, size, columns, count)``.
+        Entries are started in order, so put what's needed first at the front.
+        """
+        executor = ThreadPoolExecutor(workers, thread_name_prefix="assets")
+        futures = {}
+        for entry in manifest:
+            spec = self._spec(*entry)
+            key = spec[0]
+            with self._lock:
+                if key in self._assets:
+                    future = Future()
+                    future.set_result(self._assets[key])
+                elif key in self._pending:
+                    future = self._pending[key]
+                else:
+                    future = self._pending[key] = executor.submit(self._load, *spec)
+            futures[key] = future
+        # The threads finish the queued loads and then exit on their own.
+        executor.shutdown(wait=False)
+        return Preload(self, futures)
+
+    def report(self) -> list[AssetRecord]:
+        with self._lock:
+            return [
+                AssetRecord(*record, self._requests[key])
+                for key, record in self._records.items()
+            ]
+
+    def clear(self):
+        with self._lock:
+            self._assets.clear()
+            self._records.clear()
+            self._requests.clear()
+
+
+def _texture_size(texture):
+    # Textures keep their decoded image as RGBA.
+    return texture.image.width * texture.image.height * 4
+
+
+def _sound_size(sound):
+    # Only fully decoded (non-streaming) sounds hold their samples.
+    return len(getattr(sound.source, "_data", b""))
+
+
+def format_report(records):
+    lines = [f"{'kind':<8} {'asset':<52} {'ms':>8} {'KiB':>9} {'uses':>5}"]
+    for record in records:
+        lines.append(
+            f"{record.kind:<8} {record.name:<52} {record.load_time * 1000:>8.2f}"
+            f" {record.size / 1024:>9.1f} {record.requests:>5}"
+        )
+    total_time = sum(record.load_time for record in records)
+    total_size = sum(record.size for record in records)
+    lines.append(f"{'total':<61} {total_time * 1000:>8.2f} {total_size / 1024:>9.1f}")
+    return "\n".join(lines)
+
+
+assets = AssetCache()
@@ -0,0 +1,171 @@
+"""Prebuilt sprite atlases: many textures packed into one image on disk.
+
+Each texture is trimmed to its visible pixels and shelf-packed into a single
+RGBA image. The index keeps where each one sits, the full frame it was
+trimmed from and its precomputed hit box, so loading it back needs neither
+the original files nor a hit box pass. Textures come back at their original
+size, with the same pixels and hit box as when they were loaded directly.
+
+The file is a fixed header, then one index record per texture (its name,
+rect, frame, offset and hit box points), then the atlas image as a
+zlib-compressed RGBA buffer, so the whole atlas is one read and one inflate.
+"""
+
+import math
+import struct
+import zlib
+from pathlib import Path
+from typing import NamedTuple
+
+import arcade
+import PIL.Image
+
+MAGIC = b"MMAT"
+VERSION = 1
+
+# Magic, version, image width and height, region count.
+HEADER = struct.Struct("<4sBHHI")
+# Rect in the image, full frame size, offset of the rect in the frame, name
+# length in bytes and number of hit box points.
+_REGION = struct.Struct("<HHHHHHHHHH")
+_POINT = struct.Struct("<ff")
+
+
+def grid_frame_name(path, size, columns, index):
+    """The atlas name of cell ``index`` of a spritesheet grid."""
+    return f"{path}[{size[0]}x{size[1]}/{columns}:{index}]"
+
+
+class AtlasRegion(NamedTuple):
+    name: str
+    rect: tuple  # x, y, width, height in the atlas image
+    frame: tuple  # width and height of the texture before trimming
+    offset: tuple  # where the trimmed rect sat in the frame
+    hit_box: tuple  # points relative to the frame's center
+
+
+class SpriteAtlas:
+    """Textures packed into one image, built with :meth:`build` and read back
+    with :meth:`load`. Divide a region's ``rect`` by :attr:`size` for its UV
+    rect."""
+
+    def __init__(self, image, regions):
+        self.image = image
+        self.regions = {region.name: region for region in regions}
+
+    @property
+    def size(self):
+        return self.image.size
+
+    def __contains__(self, name):
+        return name in self.regions
+
+    def __len__(self):
+        return len(self.regions)
+
+    @classmethod
+    def build(cls, textures):
+        """Pack ``textures``, a mapping of names to ``arcade.Texture``, keeping
+        each one's image and hit box."""
+        trimmed = []
+        for name, texture in textures.items():
+            image = texture.image.convert("RGBA")
+            box = image.getbbox() or (0, 0, 1, 1)
+            trimmed.append((name, texture, image.crop(box), box[:2]))
+
+        # Shelf packing, tallest first, into the narrowest power-of-two width
+        # that's at least as wide as the squared-up area.
+        trimmed.sort(key=lambda item: (-item[2].height, item[0]))
+        area = sum(image.width * image.height for _, _, image, _ in trimmed)
+        widest = max(image.width for _, _, image, _ in trimmed)
+        width = 1 << math.ceil(math.log2(max(widest, math.isqrt(area), 1)))
+        placed = []
+        x = y = shelf_height = 0
+        for name, texture, image, offset in trimmed:
+            if x + image.width > width:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            placed.append((name, texture, image, offset, x, y))
+            x += image.width
+            shelf_height = max(shelf_height, image.height)
+
+        atlas = PIL.Image.new("RGBA", (width, y + shelf_height), (0, 0, 0, 0))
+        regions = []
+        for name, texture, image, offset, x, y in placed:
+            atlas.paste(image, (x, y))
+            regions.append(
+                AtlasRegion(
+                    name,
+                    (x, y, image.width, image.height),
+                    texture.image.size,
+                    offset,
+                    tuple(tuple(point) for point in texture.hit_box_points),
+                )
+            )
+        regions.sort(key=lambda region: region.name)
+        return cls(atlas, regions)
+
+    def save(self, path):
+        width, height = self.size
+        out = bytearray(HEADER.pack(MAGIC, VERSION, width, height, len(self.regions)))
+        for region in self.regions.values():
+            name = region.name.encode()
+            out += _REGION.pack(
+                *region.rect,
+                *region.frame,
+                *region.offset,
+                len(name),
+                len(region.hit_box),
+            )
+            out += name
+            for point in region.hit_box:
+                packed = _POINT.pack(*point)
+                if _POINT.unpack(packed) != tuple(point):
+                    raise ValueError(f"hit box of {region.name} doesn't fit a float32")
+                out += packed
+        out += zlib.compress(self.image.tobytes(), 9)
+        Path(path).write_bytes(out)
+
+    @classmethod
+    def load(cls, path):
+        data = Path(path).read_bytes()
+        magic, version, width, height, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a sprite atlas")
+        if version != VERSION:
+            raise ValueError(f"unsupported sprite atlas version {version}")
+        offset = HEADER.size
+        regions = []
+        for _ in range(count):
+            fields = _REGION.unpack_from(data, offset)
+            offset += _REGION.size
+            name_length, point_count = fields[8:]
+            name = data[offset : offset + name_length].decode()
+            offset += name_length
+            hit_box = tuple(
+                _POINT.iter_unpack(data[offset : offset + point_count * _POINT.size])
+            )
+            offset += point_count * _POINT.size
+            regions.append(
+                AtlasRegion(name, fields[0:4], fields[4:6], fields[6:8], hit_box)
+            )
+        pixels = zlib.decompress(data[offset:])
+        image = PIL.Image.frombuffer(
+            "RGBA", (width, height), pixels, "raw", "RGBA", 0, 1
+        )
+        return cls(image, regions)
+
+    def texture(self, name) -> arcade.Texture:
+        """A new texture of the named region at its original size."""
+        region = self.regions[name]
+        x, y, width, height = region.rect
+        image = self.image.crop((x, y, x + width, y + height))
+        if region.frame != (width, height):
+            frame = PIL.Image.new("RGBA", region.frame, (0, 0, 0, 0))
+            frame.paste(image, region.offset)
+            image = frame
+        # A name-based hash spares arcade hashing every pixel.
+        return arcade.Texture(
+            image, hit_box_points=region.hit_box, hash=f"atlas:{name}"
+        )
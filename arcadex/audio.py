@@ -0,0 +1,128 @@
+import math
+import time
+
+import arcade
+from pyglet import media
+
+MAX_VOICES = 16
+VOICES_PER_SOUND = 4
+
+
+class _Voice:
+    __slots__ = ("ends_at", "player", "sound")
+
+    def __init__(self, sound):
+        self.player = media.Player()
+        self.sound = sound
+        self.ends_at = 0.0
+
+
+class Mixer:
+    """Plays sounds on a bounded set of reusable players.
+
+    :meth:`trigger` only notes that a sound should play; :meth:`flush`, once
+    per tick or frame, starts each sound triggered since the last flush once.
+    Extra triggers of the same sound are merged into that one playback,
+    louder by the square root of their number (capped at full volume), rather
+    than stacking identical voices.
+
+    A sound gets at most ``voices_per_sound`` players and the mixer
+    ``max_voices`` in all. Players are kept and requeued instead of made per
+    playback; when a sound needs a voice past either limit, the one that
+    has been playing longest is stolen, preferring a voice that has finished.
+    Only static (non-streaming) sounds, ``arcade.load_sound``'s default, can
+    be played more than once at a time.
+    """
+
+    def __init__(
+        self,
+        max_voices=MAX_VOICES,
+        voices_per_sound=VOICES_PER_SOUND,
+        clock=time.perf_counter,
+    ):
+        self.max_voices = max_voices
+        self.voices_per_sound = voices_per_sound
+        self.clock = clock
+        self.voices: list[_Voice] = []
+        self._by_sound: dict[arcade.Sound, list[_Voice]] = {}
+        self._pending: dict[arcade.Sound, list] = {}
+        # Triggers received, playbacks started, triggers merged into another
+        # of the same flush, and playing voices cut off for a new sound.
+        self.triggered = 0
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    def trigger(self, sound, volume=1.0):
+        self.triggered += 1
+        pending = self._pending.get(sound)
+        if pending is None:
+            self._pending[sound] = [1, volume]
+        else:
+            pending[0] += 1
+            pending[1] = max(pending[1], volume)
+            self.dropped += 1
+
+    def flush(self):
+        if not self._pending:
+            return
+        now = self.clock()
+        for sound, (count, volume) in self._pending.items():
+            self._play(sound, min(volume * math.sqrt(count), 1.0), now)
+        self._pending.clear()
+
+    def _voice_for(self, sound, now):
+        voices = self._by_sound.setdefault(sound, [])
+        for voice in voices:
+            if voice.ends_at <= now:
+                return voice
+        if len(voices) < self.voices_per_sound:
+            if len(self.voices) < self.max_voices:
+                voice = _Voice(sound)
+                self.voices.append(voice)
+                voices.append(voice)
+                return voice
+            # Out of voices overall: take another sound's, finished or not.
+            candidates = self.voices
+        else:
+            candidates = voices
+        voice = min(candidates, key=lambda voice: voice.ends_at)
+        if voice.ends_at > now:
+            self.stolen += 1
+        if voice.sound is not sound:
+            self._by_sound[voice.sound].remove(voice)
+            voice.sound = sound
+            voices.append(voice)
+        return voice
+
+    def _play(self, sound, volume, now):
+        voice = self._voice_for(sound, now)
+        player = voice.player
+        if player.source is not None:
+            player.next_source()  # cut off whatever it's still playing
+        player.volume = volume
+        player.queue(sound.source)
+        player.play()
+        voice.ends_at = now + sound.get_length()
+        self.played += 1
+
+    def voices_in_use(self) -> int:
+        now = self.clock()
+        return sum(voice.ends_at > now for voice in self.voices)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "voices": len(self.voices),
+            "in_use": self.voices_in_use(),
+            "triggered": self.triggered,
+            "played": self.played,
+            "dropped": self.dropped,
+            "stolen": self.stolen,
+        }
+
+    def close(self):
+        for voice in self.voices:
+            voice.player.delete()
+        self.voices.clear()
+        self._by_sound.clear()
+        self._pending.clear()
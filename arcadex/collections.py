@@ -1,45 +1,212 @@
+from typing import Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
 import arcade
 
-class SpritePool:
-    def __init__(self, sprites):
-        self.sprites = sprites
-        self.active_status = [False] * len(sprites)
-        self.sprite_list = arcade.SpriteList()
-
-    def request_sprite(self):
-        for index, status in enumerate(self.active_status):
-            if not status:
-                self.active_status[index] = True
-                self.sprite_list.append(self.sprites[index])
-                return self.sprites[index]
-        return None  # Return None if no inactive sprites are available
-
-    def deactivate_sprite(self, sprite):
-        if sprite in self.sprites:
-            index = self.sprites.index(sprite)
-            if self.active_status[index]:
-                self.active_status[index] = False
-                self.sprite_list.remove(sprite)
+SpriteT = TypeVar("SpriteT", bound=arcade.BasicSprite)
+
+
+class SpritePool(Generic[SpriteT]):
+    """A set of reusable sprites that can grow on demand.
+
+    Every pooled sprite stays in ``sprite_list`` for the life of the pool and
+    is hidden while it's free, so requesting and releasing a sprite never
+    touches the SpriteList's internal buffers. Free sprites sit on a stack of
+    slot indices and active ones in the dense ``active`` list, which makes
+    both operations O(1).
+
+    With a ``factory`` the pool creates ``initial_size`` sprites up front and
+    more whenever a request finds no free sprite, up to ``max_size`` sprites
+    in total when that's given. ``reset`` is called on every sprite as it's
+    released, to put it back in a reusable state.
+    """
+
+    def __init__(
+        self,
+        sprites: Iterable[SpriteT] = (),
+        *,
+        factory: Optional[Callable[[], SpriteT]] = None,
+        initial_size: int = 0,
+        max_size: Optional[int] = None,
+        reset: Optional[Callable[[SpriteT], None]] = None,
+    ):
+        self.factory = factory
+        self.max_size = max_size
+        self.reset = reset
+        self.sprites: list[SpriteT] = []
+        self.slots: dict[SpriteT, int] = {}
+        self.active_status: list[bool] = []
+        self.free_slots: list[int] = []
+        self.active: list[SpriteT] = []
+        self._active_positions: list[int] = []
+        self.sprite_list: arcade.SpriteList[SpriteT] = arcade.SpriteList()
+        # Requests served from a free sprite, requests that had to grow the
+        # pool or came back empty, and the most sprites ever active at once.
+        self.hits = 0
+        self.misses = 0
+        self.high_water = 0
+
+        sprites = list(sprites)
+        if factory is not None:
+            sprites.extend(factory() for _ in range(initial_size - len(sprites)))
+        for sprite in sprites:
+            self._add(sprite)
+        # Popped from the end, so the lowest slots are handed out first.
+        self.free_slots.reverse()
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def __contains__(self, sprite: SpriteT) -> bool:
+        index = self.slots.get(sprite)
+        return index is not None and self.active_status[index]
+
+    def __iter__(self) -> Iterator[SpriteT]:
+        # Walk backwards: deactivating the sprite being visited swaps the last
+        # active sprite, which has already been visited, into its place.
+        active = self.active
+        index = len(active)
+        while index:
+            index -= 1
+            yield active[index]
+
+    def _add(self, sprite: SpriteT):
+        index = len(self.sprites)
+        self.sprites.append(sprite)
+        self.slots[sprite] = index
+        self.active_status.append(False)
+        self._active_positions.append(0)
+        self.free_slots.append(index)
+        sprite.visible = False
+        self.sprite_list.append(sprite)
+
+    def _grow(self) -> bool:
+        if self.factory is None:
+            return False
+        if self.max_size is not None and len(self.sprites) >= self.max_size:
+            return False
+        self._add(self.factory())
+        return True
+
+    def reserve(self, count: int):
+        """Grow the pool to at least ``count`` sprites now rather than on the
+        requests that would need them."""
+        start = len(self.free_slots)
+        while len(self.sprites) < count and self._grow():
+            pass
+        # New sprites go under the free ones already there, lowest slot on
+        # top, so they're handed out where the pool would have grown.
+        added = self.free_slots[start:]
+        del self.free_slots[start:]
+        self.free_slots[:0] = added[::-1]
+
+    def request_sprite(self) -> Optional[SpriteT]:
+        if self.free_slots:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if not self._grow():
+                return None  # Return None if no inactive sprites are available
+        index = self.free_slots.pop()
+        sprite = self.sprites[index]
+        self.active_status[index] = True
+        self._active_positions[index] = len(self.active)
+        self.active.append(sprite)
+        self.high_water = max(self.high_water, len(self.active))
+        sprite.visible = True
+        return sprite
+
+    def deactivate_sprite(self, sprite: SpriteT):
+        index = self.slots.get(sprite)
+        if index is None or not self.active_status[index]:
+            return
+        self.active_status[index] = False
+        position = self._active_positions[index]
+        last = self.active.pop()
+        if last is not sprite:
+            self.active[position] = last
+            self._active_positions[self.slots[last]] = position
+        self._free(index, sprite)
 
     def deactivate_all(self):
-        for s in self.get_active_sprites():
-            self.deactivate_sprite(s)
+        for sprite in self.active:
+            index = self.slots[sprite]
+            self.active_status[index] = False
+            self._free(index, sprite)
+        self.active.clear()
 
-    def get_active_sprites(self):
-        return [
-            sprite for sprite, active in zip(self.sprites, self.active_status) if active
-        ]
+    def reset_slots(self):
+        """Free every sprite and stack the free slots in slot order, lowest
+        on top, the way a new pool has them, so what the pool hands out next
+        no longer depends on what it did before."""
+        self.deactivate_all()
+        self.free_slots[:] = range(len(self.sprites) - 1, -1, -1)
+
+    def _free(self, index: int, sprite: SpriteT):
+        self.free_slots.append(index)
+        sprite.visible = False
+        if self.reset is not None:
+            self.reset(sprite)
 
-    def get_inactive_sprites(self):
+    def get_active_sprites(self) -> list[SpriteT]:
+        return list(self.active)
+
+    def get_inactive_sprites(self) -> list[SpriteT]:
         return [
             sprite
             for sprite, active in zip(self.sprites, self.active_status)
             if not active
         ]
 
-    def update(self):
-        self.sprite_list.update()
+    def state(self) -> tuple[list[int], list[int]]:
+        """The active slots in iteration order and the free slot stack, which
+        together decide everything the pool will do next."""
+        slots = self.slots
+        free = self.free_slots
+        # Highest slots at the bottom of the stack, in order, are handed out
+        # just as a smaller pool would grow into them, so they're left out:
+        # pools that differ only in how far they've grown give the same state.
+        top = len(self.sprites)
+        bottom = 0
+        while bottom < len(free) and free[bottom] == top - 1:
+            top -= 1
+            bottom += 1
+        return [slots[sprite] for sprite in self.active], free[bottom:]
+
+    def restore_state(self, active_slots: list[int], free_slots: list[int]):
+        """Put the pool back the way :meth:`state` found it. Sprites are only
+        shown or hidden; their own attributes are the caller's to restore."""
+        while len(self.sprites) < len(active_slots) + len(free_slots):
+            if not self._grow():
+                raise ValueError("pool can't grow to the size of the saved state")
+        sprites = self.sprites
+        for sprite in self.active:
+            sprite.visible = False
+        status = self.active_status
+        status[:] = [False] * len(sprites)
+        self.active = [sprites[index] for index in active_slots]
+        for position, index in enumerate(active_slots):
+            status[index] = True
+            self._active_positions[index] = position
+            sprites[index].visible = True
+        # Sprites added since the state was taken go to the bottom of the
+        # stack, so they're only handed out where the pool would have grown.
+        saved = set(active_slots)
+        saved.update(free_slots)
+        extra = [index for index in range(len(sprites)) if index not in saved]
+        self.free_slots[:] = extra[::-1] + list(free_slots)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self.sprites),
+            "active": len(self.active),
+            "high_water": self.high_water,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def update(self, delta_time: float = 1 / 60):
+        for sprite in self:
+            sprite.update(delta_time)
 
     def draw(self):
         self.sprite_list.draw()
-
@@ -0,0 +1,124 @@
+from typing import Generic, Iterable, Sequence, TypeVar
+
+import arcade
+import numpy as np
+
+SpriteT = TypeVar("SpriteT", bound=arcade.BasicSprite)
+OtherT = TypeVar("OtherT", bound=arcade.BasicSprite)
+
+# arcade.check_for_collision rejects a pair outright when their centers are
+# further apart than this fraction of their summed largest dimensions.
+_COLLISION_RADIUS = 0.71
+
+
+def _extent(sprite: arcade.BasicSprite) -> float:
+    width, height = sprite.size
+    return (width if width > height else height) * _COLLISION_RADIUS
+
+
+class SpatialGrid(Generic[SpriteT]):
+    """Uniform-grid broad phase for sprites that all move every frame.
+
+    Unlike a SpriteList's spatial hash, which is updated on every position
+    change, the grid is rebuilt from scratch with :meth:`rebuild` once per
+    frame, after everything has moved. Each sprite goes in the one cell under
+    its center, along with its position and collision extent; queries widen
+    their search by the largest extent seen, reject distant entries with a
+    bounding-square test, and only run the exact polygon test on the rest.
+    That finds every pair ``arcade.check_for_collision`` would report.
+    """
+
+    def __init__(self, cell_size: int = 128):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[tuple[SpriteT, float, float, float]]]
+        self.cells = {}
+        self.max_extent = 0.0
+
+    def rebuild(self, sprites: Iterable[SpriteT]):
+        cells: dict[tuple[int, int], list[tuple[SpriteT, float, float, float]]] = {}
+        size = self.cell_size
+        max_extent = 0.0
+        for sprite in sprites:
+            x, y = sprite.position
+            extent = _extent(sprite)
+            if extent > max_extent:
+                max_extent = extent
+            entry = (sprite, x, y, extent)
+            key = (int(x // size), int(y // size))
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [entry]
+            else:
+                cell.append(entry)
+        self.cells = cells
+        self.max_extent = max_extent
+
+    def candidates(self, sprite: arcade.BasicSprite) -> list[SpriteT]:
+        x, y = sprite.position
+        extent = _extent(sprite)
+        reach = extent + self.max_extent
+        size = self.cell_size
+        cells = self.cells
+        found: list[SpriteT] = []
+        for column in range(int((x - reach) // size), int((x + reach) // size) + 1):
+            for row in range(int((y - reach) // size), int((y + reach) // size) + 1):
+                cell = cells.get((column, row))
+                if cell is None:
+                    continue
+                for other, other_x, other_y, other_extent in cell:
+                    limit = extent + other_extent
+                    if (
+                        -limit <= other_x - x <= limit
+                        and -limit <= other_y - y <= limit
+                    ):
+                        found.append(other)
+        return found
+
+    def collisions(self, sprite: arcade.BasicSprite) -> list[SpriteT]:
+        return [
+            other
+            for other in self.candidates(sprite)
+            if arcade.check_for_collision(sprite, other)
+        ]
+
+
+def _centers_and_sizes(sprites: Sequence[arcade.BasicSprite]):
+    count = len(sprites)
+    centers = np.fromiter(
+        (coordinate for sprite in sprites for coordinate in sprite.position),
+        dtype=np.float64,
+        count=count * 2,
+    ).reshape(count, 2)
+    sizes = np.fromiter(
+        (max(sprite.size) for sprite in sprites), dtype=np.float64, count=count
+    )
+    return centers, sizes
+
+
+def collide_batched(
+    sprites: Sequence[SpriteT], others: Sequence[OtherT], exact: bool = True
+) -> list[tuple[SpriteT, OtherT]]:
+    """Find every colliding ``(sprite, other)`` pair between two groups.
+
+    All ``len(sprites) * len(others)`` pairs go through
+    ``arcade.check_for_collision``'s own bounding-circle rejection in one
+    array operation. With ``exact`` the survivors are then confirmed with the
+    polygon test, so the result is exactly what calling
+    ``check_for_collision`` on every pair would give; without it the circle
+    overlap is taken as a hit. Pairs come back ordered by ``sprites`` and then
+    by ``others``.
+    """
+    if not len(sprites) or not len(others):
+        return []
+    centers, sizes = _centers_and_sizes(sprites)
+    other_centers, other_sizes = _centers_and_sizes(others)
+    # Same arithmetic, in the same order, as arcade's early out, so a pair on
+    # the boundary is judged the same way by both paths.
+    radius_sum = (sizes[:, None] + other_sizes[None, :]) * _COLLISION_RADIUS
+    diff_x = centers[:, 0, None] - other_centers[None, :, 0]
+    diff_y = centers[:, 1, None] - other_centers[None, :, 1]
+    near = diff_x * diff_x + diff_y * diff_y <= radius_sum * radius_sum
+    pairs = [(sprites[i], others[j]) for i, j in zip(*np.nonzero(near))]
+    if exact:
+        pairs = [pair for pair in pairs if arcade.check_for_collision(*pair)]
+    return pairs
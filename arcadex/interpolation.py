@@ -0,0 +1,55 @@
+from contextlib import contextmanager
+from typing import Iterable
+
+import arcade
+
+
+class Interpolator:
+    """Draws sprites part way between their last two simulation ticks.
+
+    Call :meth:`capture` right before each tick to remember where the sprites
+    were, then draw inside :meth:`interpolated` with ``alpha`` being how far
+    the display is past that tick (0 to 1). Sprites are moved to the blended
+    position for the draw and put back afterwards, so the simulation never
+    sees it. Sprites that weren't captured (spawned during the tick) or that
+    moved further than ``snap_distance`` (wrapped or were reset) are drawn
+    where they are.
+    """
+
+    def __init__(self, snap_distance: float = 64):
+        self.snap_distance = snap_distance
+        self.previous: dict[arcade.BasicSprite, tuple[float, float]] = {}
+        self._drawn: list[tuple[arcade.BasicSprite, tuple[float, float]]] = []
+
+    def capture(self, groups: Iterable[Iterable[arcade.BasicSprite]]):
+        previous = self.previous
+        previous.clear()
+        for group in groups:
+            for sprite in group:
+                previous[sprite] = sprite.position
+
+    @contextmanager
+    def interpolated(
+        self, groups: Iterable[Iterable[arcade.BasicSprite]], alpha: float
+    ):
+        previous = self.previous
+        drawn = self._drawn
+        snap = self.snap_distance
+        for group in groups:
+            for sprite in group:
+                start = previous.get(sprite)
+                if start is None:
+                    continue
+                end = sprite.position
+                dx = end[0] - start[0]
+                dy = end[1] - start[1]
+                if abs(dx) > snap or abs(dy) > snap:
+                    continue
+                drawn.append((sprite, end))
+                sprite.position = (start[0] + dx * alpha, start[1] + dy * alpha)
+        try:
+            yield
+        finally:
+            for sprite, position in drawn:
+                sprite.position = position
+            drawn.clear()
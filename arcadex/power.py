@@ -0,0 +1,126 @@
+import time
+
+ACTIVE = "active"
+IDLE = "idle"  # nothing on screen changes, such as a game-over screen
+BACKGROUND = "background"  # the window doesn't have the focus
+MINIMIZED = "minimized"
+
+# Seconds between draws and between updates in each state; None keeps the
+# window's full rate. A background game keeps updating so it plays on.
+RATES = {
+    ACTIVE: (None, None),
+    IDLE: (1 / 4, 1 / 10),
+    BACKGROUND: (1 / 15, None),
+    MINIMIZED: (1.0, None),
+}
+INPUT_GRACE = 2.0  # seconds at full rate after any input
+
+
+class CpuMeter:
+    """Process CPU time per second of wall-clock time, kept separately for
+    each state :meth:`switch` is told about. A usage of 1.0 is one core."""
+
+    def __init__(self, clock=time.perf_counter, cpu_clock=time.process_time):
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self.totals: dict[str, list[float]] = {}  # state: [cpu, wall] seconds
+        self.state = None
+        self._wall = clock()
+        self._cpu = cpu_clock()
+
+    def _charge(self):
+        wall = self.clock()
+        cpu = self.cpu_clock()
+        if self.state is not None:
+            totals = self.totals.setdefault(self.state, [0.0, 0.0])
+            totals[0] += cpu - self._cpu
+            totals[1] += wall - self._wall
+        self._wall = wall
+        self._cpu = cpu
+
+    def switch(self, state):
+        self._charge()
+        self.state = state
+
+    def usage(self) -> dict[str, float]:
+        self._charge()
+        return {state: cpu / wall for state, (cpu, wall) in self.totals.items() if wall}
+
+    def format(self) -> str:
+        return "\n".join(
+            f"{state:<12} {usage:>6.1%} of a core, {self.totals[state][1]:.1f} s"
+            for state, usage in self.usage().items()
+        )
+
+
+class PowerGovernor:
+    """Slows a window's draw and update rates while running flat out would
+    only redraw the same screen.
+
+    The window reports what it knows through :meth:`set_idle`,
+    :meth:`set_focused`, :meth:`set_minimized` and :meth:`input`, and the
+    governor picks a state from them: minimized, then idle, then background,
+    otherwise active. Any input puts it back to full rate at once and keeps
+    it there for ``INPUT_GRACE`` seconds. Rates are only changed when the
+    state does, and ``meter`` keeps the CPU use of each state.
+    """
+
+    def __init__(
+        self,
+        window,
+        full_rate=1 / 60,
+        enabled=True,
+        rates=RATES,
+        clock=time.perf_counter,
+    ):
+        self.window = window
+        self.full_rate = full_rate
+        self.enabled = enabled
+        self.rates = rates
+        self.clock = clock
+        self.idle = False
+        self.focused = True
+        self.minimized = False
+        self.last_input = clock()
+        self.state = ACTIVE
+        self.meter = CpuMeter(clock)
+        self.meter.switch(ACTIVE)
+
+    def input(self):
+        self.last_input = self.clock()
+        self.update()
+
+    def set_idle(self, idle):
+        self.idle = idle
+        self.update()
+
+    def set_focused(self, focused):
+        self.focused = focused
+        self.update()
+
+    def set_minimized(self, minimized):
+        self.minimized = minimized
+        self.update()
+
+    def current_state(self):
+        if not self.enabled:
+            return ACTIVE
+        if self.minimized:
+            return MINIMIZED
+        if self.clock() - self.last_input < INPUT_GRACE:
+            return ACTIVE
+        if self.idle:
+            return IDLE
+        if not self.focused:
+            return BACKGROUND
+        return ACTIVE
+
+    def update(self):
+        state = self.current_state()
+        if state == self.state:
+            return
+        self.state = state
+        self.meter.switch(state)
+        draw_rate, update_rate = self.rates[state]
+        self.window.set_draw_rate(draw_rate or self.full_rate)
+        self.window.set_update_rate(update_rate or self.full_rate)
@@ -0,0 +1,262 @@
+import csv
+import json
+import time
+from pathlib import Path
+
+import arcade
+import numpy as np
+
+MAX_PHASES = 32
+EVENTS_PER_FRAME = 64  # room in the event ring for each frame of the buffer
+
+
+class FrameProfiler:
+    """Times the phases of each frame into fixed-size ring buffers.
+
+    Call :meth:`frame` once at the top of every frame, then :meth:`lap` after
+    each phase with its name: a lap is charged the time since the previous
+    lap, or since :meth:`mark` when the time in between shouldn't count. A
+    phase that runs several times in a frame, such as a simulation tick, adds
+    up. The last ``capacity`` frames are kept, as the time of each phase and
+    of the frame as a whole, along with every lap for a trace.
+
+    While disabled, :meth:`frame`, :meth:`lap` and :meth:`mark` return
+    straight away, so the calls can stay in place.
+    """
+
+    def __init__(self, capacity=600, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.phases: list[str] = []
+        self._columns: dict[str, int] = {}
+        # Seconds spent in each phase of each frame, and in the whole frame.
+        self.durations = np.zeros((capacity, MAX_PHASES))
+        self.frame_times = np.zeros(capacity)
+        self.frame_starts = np.zeros(capacity)
+        self.frames = 0
+        event_capacity = capacity * EVENTS_PER_FRAME
+        self.event_phases = np.zeros(event_capacity, np.int16)
+        self.event_starts = np.zeros(event_capacity)
+        self.event_durations = np.zeros(event_capacity)
+        self.events = 0
+        self._current = [0.0] * MAX_PHASES
+        self._frame_start = None
+        self._mark = 0.0
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        # The frame in progress is dropped, so a later enable() doesn't count
+        # the time spent disabled as one long frame.
+        self.enabled = False
+        self._frame_start = None
+        self._current = [0.0] * MAX_PHASES
+
+    def frame(self):
+        """End the frame in progress, if any, and start the next one."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            row = self.frames % self.capacity
+            self.frame_starts[row] = self._frame_start
+            self.frame_times[row] = now - self._frame_start
+            self.durations[row] = self._current
+            self.frames += 1
+            self._current = [0.0] * MAX_PHASES
+        self._frame_start = now
+        self._mark = now
+
+    def mark(self):
+        """Start timing the next lap from now."""
+        if not self.enabled:
+            return
+        self._mark = time.perf_counter()
+
+    def lap(self, name):
+        """Charge the time since the last lap or mark to phase ``name``."""
+        if not self.enabled or self._frame_start is None:
+            return
+        now = time.perf_counter()
+        column = self._columns.get(name)
+        if column is None:
+            column = self._add_phase(name)
+        self._current[column] += now - self._mark
+        index = self.events % len(self.event_phases)
+        self.event_phases[index] = column
+        self.event_starts[index] = self._mark
+        self.event_durations[index] = now - self._mark
+        self.events += 1
+        self._mark = now
+
+    def _add_phase(self, name):
+        if len(self.phases) == MAX_PHASES:
+            raise ValueError(f"a FrameProfiler times at most {MAX_PHASES} phases")
+        column = self._columns[name] = len(self.phases)
+        self.phases.append(name)
+        return column
+
+    def _rows(self, total, capacity):
+        # Ring buffer indices of what's held, oldest first.
+        count = min(total, capacity)
+        return (np.arange(count) + total - count) % capacity
+
+    def percentiles(self, percentiles=(50, 99)) -> dict[str, np.ndarray]:
+        """Each phase's and the whole frame's time, in seconds, at each of
+        ``percentiles`` over the frames held."""
+        count = min(self.frames, self.capacity)
+        if not count:
+            return {}
+        durations = self.durations[:count, : len(self.phases)]
+        values = np.percentile(durations, percentiles, axis=0)
+        summary = {"frame": np.percentile(self.frame_times[:count], percentiles)}
+        for column, name in enumerate(self.phases):
+            summary[name] = values[:, column]
+        return summary
+
+    def histogram(self, bins=24, limit=1 / 20):
+        """Counts of frame times in ``bins`` equal bins from 0 to ``limit``
+        seconds, with slower frames in the last bin, and the bin edges."""
+        count = min(self.frames, self.capacity)
+        frame_times = np.minimum(self.frame_times[:count], limit)
+        return np.histogram(frame_times, bins=bins, range=(0, limit))
+
+    def export(self, path):
+        """Write what's held to ``path``: CSV for ``.csv``, a Chrome trace for
+        ``.trace.json`` (open it in chrome://tracing or Perfetto) and plain
+        JSON for any other ``.json``."""
+        path = Path(path)
+        if path.suffix == ".csv":
+            self.write_csv(path)
+        elif path.name.endswith(".trace.json"):
+            self.write_chrome_trace(path)
+        elif path.suffix == ".json":
+            self.write_json(path)
+        else:
+            raise ValueError(f"can't tell what format to write {path} in")
+
+    def write_csv(self, path):
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(
+                ["frame", "start_s", "frame_ms"]
+                + [f"{name}_ms" for name in self.phases]
+            )
+            phases = len(self.phases)
+            for frame, row in enumerate(self._rows(self.frames, self.capacity)):
+                writer.writerow(
+                    [frame, f"{self.frame_starts[row]:.6f}"]
+                    + [f"{self.frame_times[row] * 1000:.4f}"]
+                    + [f"{value * 1000:.4f}" for value in self.durations[row, :phases]]
+                )
+
+    def write_json(self, path):
+        rows = self._rows(self.frames, self.capacity)
+        phases = len(self.phases)
+        data = {
+            "phases": self.phases,
+            "frame_starts_s": self.frame_starts[rows].tolist(),
+            "frame_ms": (self.frame_times[rows] * 1000).tolist(),
+            "phase_ms": (self.durations[rows, :phases] * 1000).tolist(),
+            "percentiles_ms": {
+                name: {"p50": values[0] * 1000, "p99": values[1] * 1000}
+                for name, values in self.percentiles().items()
+            },
+        }
+        Path(path).write_text(json.dumps(data))
+
+    def write_chrome_trace(self, path):
+        # Complete ("X") events in microseconds: frames, and the laps within
+        # them, nest on one thread in the trace viewer.
+        events = []
+        for row in self._rows(self.frames, self.capacity):
+            events.append(
+                {
+                    "name": "frame",
+                    "ph": "X",
+                    "ts": self.frame_starts[row] * 1e6,
+                    "dur": self.frame_times[row] * 1e6,
+                    "pid": 1,
+                    "tid": 1,
+                }
+            )
+        for index in self._rows(self.events, len(self.event_phases)):
+            events.append(
+                {
+                    "name": self.phases[self.event_phases[index]],
+                    "ph": "X",
+                    "ts": self.event_starts[index] * 1e6,
+                    "dur": self.event_durations[index] * 1e6,
+                    "pid": 1,
+                    "tid": 1,
+                }
+            )
+        Path(path).write_text(json.dumps({"traceEvents": events}))
+
+
+class ProfilerOverlay:
+    """Draws a :class:`FrameProfiler`'s p50 and p99 per phase and a histogram
+    of recent frame times in a corner of the window.
+
+    The table is only rebuilt every ``refresh`` frames, since laying out text
+    would otherwise be the most expensive phase on the screen. ``counters``,
+    when given, returns a dict of other figures to list under it.
+    """
+
+    HISTOGRAM_HEIGHT = 80
+    BAR_WIDTH = 8
+
+    def __init__(self, profiler, x, y, refresh=30, counters=None):
+        self.profiler = profiler
+        self.counters = counters
+        self.refresh = refresh
+        self.frames_shown = None
+        self.x = x
+        self.y = y
+        self.text = arcade.Text(
+            text="",
+            x=x,
+            y=y,
+            color=arcade.color.LIGHT_GREEN,
+            font_size=12,
+            font_name=("Courier New", "Courier", "monospace"),
+            multiline=True,
+            width=400,
+            anchor_y="top",
+        )
+
+    def set_position(self, x, y):
+        self.x = x
+        self.y = y
+        self.text.position = (x, y)
+
+    def table(self):
+        lines = [f"{'phase':<18} {'p50 ms':>8} {'p99 ms':>8}"]
+        for name, (p50, p99) in self.profiler.percentiles().items():
+            lines.append(f"{name:<18} {p50 * 1000:>8.3f} {p99 * 1000:>8.3f}")
+        if self.counters is not None:
+            for name, value in self.counters().items():
+                lines.append(f"{name:<18} {value:>8}")
+        return "\n".join(lines)
+
+    def draw(self):
+        profiler = self.profiler
+        shown = self.frames_shown
+        if shown is None or profiler.frames >= shown + self.refresh:
+            self.frames_shown = profiler.frames
+            self.text.text = self.table()
+        self.text.draw()
+
+        counts, _ = profiler.histogram()
+        tallest = counts.max() if counts.size and counts.max() else 1
+        bottom = self.y - self.text.content_height - self.HISTOGRAM_HEIGHT - 10
+        for index, count in enumerate(counts):
+            if count:
+                arcade.draw_lbwh_rectangle_filled(
+                    self.x + index * self.BAR_WIDTH,
+                    bottom,
+                    self.BAR_WIDTH - 1,
+                    self.HISTOGRAM_HEIGHT * count / tallest,
+                    arcade.color.LIGHT_GREEN,
+                )
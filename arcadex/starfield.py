@@ -0,0 +1,385 @@
+import heapq
+import struct
+
+import arcade
+import numpy as np
+from arcade.gl import BufferDescription
+
+STAR_DENSITY = 5000  # screen pixels per star
+# Speeds, twinkle odds and twinkle lengths below are per frame at this rate;
+# a Starfield stepped at a different tick rate converts them.
+STAR_FRAME_RATE = 60
+STAR_SIZE_RANGE = (1, 3)
+STAR_SPEED_RANGE = (0.5, 2)
+TWINKLE_CHANCE = 0.001  # per star, per frame while not twinkling
+TWINKLE_FRAMES = (30, 90)
+# Index 0 means "not twinkling"; the rest map twinkle_color values to colors.
+TWINKLE_COLORS = (None, arcade.color.RED, arcade.color.BLUE)
+RESIZE_SETTLE_TIME = 0.15  # seconds without a resize event before rebuilding
+
+# Snapshot header: star count, twinkle heap length, size, frame, then the
+# PCG64 generator's state, increment and buffered 32 bits.
+_SNAPSHOT = struct.Struct("<IIddq16s16sII")
+
+
+class Starfield:
+    """Scrolling, twinkling star background stored as parallel NumPy arrays.
+
+    Every star's state lives at the same index of ``x``, ``y``, ``size``,
+    ``speed``, ``twinkle_color`` and ``twinkle_frames``, so a frame of
+    movement, wrapping and twinkling is a handful of array operations instead
+    of one Python method call per star.
+
+    The arrays are views into larger backing buffers, so resizing the field
+    only generates or drops the stars the change in area calls for.
+
+    Twinkles are scheduled rather than rolled for: ``twinkle_event`` holds the
+    frame each star next starts or stops twinkling, and a heap of those frames
+    means a frame only visits the stars whose twinkle state changes. Waiting
+    times are drawn from the geometric distribution, which is exactly what the
+    old per-frame ``random() < TWINKLE_CHANCE`` roll produced.
+    """
+
+    _FIELDS = {
+        "x": np.float32,
+        "y": np.float32,
+        "size": np.float32,
+        "speed": np.float32,
+        "twinkle_color": np.int8,
+        "twinkle_event": np.int64,
+    }
+
+    def __init__(self, width, height, seed=None, tick_rate=STAR_FRAME_RATE):
+        self.rng = np.random.default_rng(seed)
+        self.width = width
+        self.height = height
+        self.frame_scale = STAR_FRAME_RATE / tick_rate
+        self.twinkle_chance = 1 - (1 - TWINKLE_CHANCE) ** self.frame_scale
+        # Bumped whenever stars are added, dropped or moved by a resize, so
+        # renderers know to re-upload more than the per-frame changes.
+        self.generation = 0
+        self.twinkle_changed = False
+        self.frame = 0
+        self._twinkle_heap = []
+        self.count = 0
+        self.capacity = 0
+        self._buffers = {
+            name: np.zeros(0, dtype) for name, dtype in self._FIELDS.items()
+        }
+        self._pending_size = None
+        self._settle_time = 0.0
+        self._add_stars(self.target_count(width, height))
+
+    def __len__(self):
+        return self.count
+
+    def __getattr__(self, name):
+        # x, y, size, ... are the live part of each backing buffer.
+        if name in self._FIELDS:
+            return self._buffers[name][: self.count]
+        raise AttributeError(name)
+
+    @staticmethod
+    def target_count(width, height):
+        return int((width * height) / STAR_DENSITY)
+
+    def _reserve(self, capacity):
+        for name, buffer in self._buffers.items():
+            grown = np.zeros(capacity, dtype=buffer.dtype)
+            grown[: self.count] = buffer[: self.count]
+            self._buffers[name] = grown
+        self.capacity = capacity
+
+    def _add_stars(self, count):
+        if self.count + count > self.capacity:
+            self._reserve(max(self.count + count, self.capacity * 2))
+        new = slice(self.count, self.count + count)
+        rng = self.rng
+        buffers = self._buffers
+        buffers["x"][new] = rng.integers(0, self.width, count, endpoint=True)
+        buffers["y"][new] = rng.integers(0, self.height, count, endpoint=True)
+        buffers["size"][new] = rng.uniform(*STAR_SIZE_RANGE, count)
+        buffers["speed"][new] = rng.uniform(*STAR_SPEED_RANGE, count) * self.frame_scale
+        buffers["twinkle_color"][new] = 0
+        self.count += count
+        self.generation += 1
+        self.twinkle_changed = True
+        self._schedule(np.arange(new.start, new.stop), self._twinkle_waits(count))
+
+    def resize(self, width, height):
+        target = self.target_count(width, height)
+        if (width, height) == (self.width, self.height) and target == self.count:
+            return
+        if self.count:
+            x, y = self.x, self.y
+            x *= width / self.width
+            y *= height / self.height
+        self.width = width
+        self.height = height
+        # Stars are drawn independently, so the newest ones are as good a
+        # random sample to drop as any.
+        if target < self.count:
+            self.count = target
+        self.generation += 1
+        if target > self.count:
+            self._add_stars(target - self.count)
+
+    def request_resize(self, width, height):
+        # Window edge drags fire a stream of resize events; only the size the
+        # window settles on gets applied.
+        self._pending_size = (width, height)
+        self._settle_time = RESIZE_SETTLE_TIME
+
+    def apply_pending_resize(self, delta_time):
+        if self._pending_size is None:
+            return False
+        self._settle_time -= delta_time
+        if self._settle_time > 0:
+            return False
+        self.resize(*self._pending_size)
+        self._pending_size = None
+        return True
+
+    def snapshot(self):
+        """The stars, their twinkle schedule and the random generator, as a
+        compact ``bytes`` for :meth:`restore`."""
+        rng_state = self.rng.bit_generator.state
+        pcg = rng_state["state"]
+        heap = np.array(self._twinkle_heap, dtype=np.int64).reshape(-1, 2)
+        header = _SNAPSHOT.pack(
+            self.count,
+            len(heap),
+            self.width,
+            self.height,
+            self.frame,
+            pcg["state"].to_bytes(16, "little"),
+            pcg["inc"].to_bytes(16, "little"),
+            rng_state["has_uint32"],
+            rng_state["uinteger"],
+        )
+        columns = [getattr(self, name).tobytes() for name in self._FIELDS]
+        return b"".join([header, *columns, heap.tobytes()])
+
+    def restore(self, data):
+        (
+            count,
+            heap_length,
+            self.width,
+            self.height,
+            self.frame,
+            state,
+            inc,
+            has_uint32,
+            uinteger,
+        ) = _SNAPSHOT.unpack_from(data)
+        rng_state = self.rng.bit_generator.state
+        rng_state["state"] = {
+            "state": int.from_bytes(state, "little"),
+            "inc": int.from_bytes(inc, "little"),
+        }
+        rng_state["has_uint32"] = has_uint32
+        rng_state["uinteger"] = uinteger
+        self.rng.bit_generator.state = rng_state
+
+        if count > self.capacity:
+            self._reserve(count)
+        self.count = count
+        offset = _SNAPSHOT.size
+        for name, dtype in self._FIELDS.items():
+            column = np.frombuffer(data, dtype, count, offset)
+            self._buffers[name][:count] = column
+            offset += column.nbytes
+        heap = np.frombuffer(data, np.int64, 2 * heap_length, offset)
+        # Saved in heap order, so it's still a valid heap.
+        self._twinkle_heap = list(zip(heap[0::2].tolist(), heap[1::2].tolist()))
+        self._pending_size = None
+        self.generation += 1
+        self.twinkle_changed = True
+
+    def _twinkle_waits(self, count):
+        return self.rng.geometric(self.twinkle_chance, count)
+
+    def _twinkle_durations(self, count):
+        frames = self.rng.integers(
+            TWINKLE_FRAMES[0], TWINKLE_FRAMES[1], count, endpoint=True
+        )
+        if self.frame_scale == 1:
+            return frames
+        return np.maximum(np.rint(frames / self.frame_scale).astype(np.int64), 1)
+
+    def _schedule(self, indices, delays):
+        events = self.frame + delays
+        self._buffers["twinkle_event"][indices] = events
+        heap = self._twinkle_heap
+        entries = zip(events.tolist(), indices.tolist())
+        if len(indices) > len(heap):
+            heap.extend(entries)
+            heapq.heapify(heap)
+        else:
+            for entry in entries:
+                heapq.heappush(heap, entry)
+
+    def _due_twinkles(self):
+        # Entries for stars dropped by a resize, or superseded by a reschedule,
+        # no longer match twinkle_event and are skipped here.
+        heap = self._twinkle_heap
+        events = self._buffers["twinkle_event"]
+        due = []
+        while heap and heap[0][0] <= self.frame:
+            frame, index = heapq.heappop(heap)
+            if index < self.count and events[index] == frame:
+                due.append(index)
+        return np.array(due, dtype=np.intp)
+
+    def update(self):
+        y = self.y
+        y -= self.speed
+        y[y < 0] = self.height
+
+        self.frame += 1
+        if not self._twinkle_heap or self._twinkle_heap[0][0] > self.frame:
+            return
+        due = self._due_twinkles()
+        if not len(due):
+            return
+
+        colors = self.twinkle_color
+        twinkling = colors[due] != 0
+        ending = due[twinkling]
+        starting = due[~twinkling]
+        if len(ending):
+            colors[ending] = 0
+            # The first roll for the next twinkle happens the frame after this.
+            self._schedule(ending, self._twinkle_waits(len(ending)))
+        if len(starting):
+            colors[starting] = self.rng.integers(1, len(TWINKLE_COLORS), len(starting))
+            self._schedule(starting, self._twinkle_durations(len(starting)))
+        self.twinkle_changed = True
+
+
+VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+uniform float pixel_ratio;
+// How far the display is between the previous update and the latest one.
+uniform float alpha;
+
+in float in_x;
+in float in_y;
+in float in_size;
+in float in_speed;
+in float in_twinkle;
+
+flat out int v_color;
+
+void main() {
+    // Instance 0 draws every star's white core, instance 1 the colored dot
+    // beside the stars that are currently twinkling.
+    int color = gl_InstanceID * int(in_twinkle);
+    if (gl_InstanceID == 1 && color == 0) {
+        gl_Position = vec4(2.0, 2.0, 2.0, 1.0);
+        gl_PointSize = 0.0;
+        return;
+    }
+    float radius = gl_InstanceID == 0 ? in_size : in_size * 0.8;
+    float x = gl_InstanceID == 0 ? in_x : in_x + in_size * 1.2;
+    float y = in_y + in_speed * (1.0 - alpha);
+    gl_Position = window.projection * window.view * vec4(x, y, 0.0, 1.0);
+    gl_PointSize = radius * 2.0 * pixel_ratio;
+    v_color = color;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+
+uniform vec4 colors[3];
+
+flat in int v_color;
+
+out vec4 f_color;
+
+void main() {
+    if (length(gl_PointCoord - vec2(0.5)) > 0.5) {
+        discard;
+    }
+    f_color = colors[v_color];
+}
+"""
+
+
+class StarfieldRenderer:
+    """Draws a whole :class:`Starfield` with one instanced point draw call.
+
+    Each star attribute has its own GPU buffer so a frame only re-uploads what
+    moved: the ``y`` column every frame, the twinkle column only when a star
+    started or stopped twinkling, and the static columns after a resize.
+    """
+
+    def __init__(self, starfield, ctx=None):
+        self.starfield = starfield
+        self.ctx = ctx or arcade.get_window().ctx
+        self.program = self.ctx.program(
+            vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER
+        )
+        self.program["colors"] = (
+            arcade.color.WHITE.normalized
+            + TWINKLE_COLORS[1].normalized
+            + TWINKLE_COLORS[2].normalized
+        )
+        self.geometry = None
+        self._generation = None
+        self._capacity = None
+
+    def _allocate(self):
+        # A zero-byte buffer isn't valid, so always reserve one float.
+        reserve = max(self.starfield.capacity, 1) * 4
+        self.x_buffer = self.ctx.buffer(reserve=reserve)
+        self.y_buffer = self.ctx.buffer(reserve=reserve, usage="stream")
+        self.size_buffer = self.ctx.buffer(reserve=reserve)
+        self.speed_buffer = self.ctx.buffer(reserve=reserve)
+        self.twinkle_buffer = self.ctx.buffer(reserve=reserve, usage="dynamic")
+        self.geometry = self.ctx.geometry(
+            [
+                BufferDescription(self.x_buffer, "f", ["in_x"]),
+                BufferDescription(self.y_buffer, "f", ["in_y"]),
+                BufferDescription(self.size_buffer, "f", ["in_size"]),
+                BufferDescription(self.speed_buffer, "f", ["in_speed"]),
+                BufferDescription(self.twinkle_buffer, "f", ["in_twinkle"]),
+            ],
+            mode=self.ctx.POINTS,
+        )
+        self._capacity = self.starfield.capacity
+
+    def sync(self):
+        starfield = self.starfield
+        if self._generation != starfield.generation:
+            # Buffers only grow with the starfield's own backing arrays, so a
+            # resize normally just rewrites the static columns in place.
+            if self._capacity != starfield.capacity:
+                self._allocate()
+            self.x_buffer.write(starfield.x)
+            self.size_buffer.write(starfield.size)
+            self.speed_buffer.write(starfield.speed)
+            starfield.twinkle_changed = True
+            self._generation = starfield.generation
+        self.y_buffer.write(starfield.y)
+        if starfield.twinkle_changed:
+            self.twinkle_buffer.write(starfield.twinkle_color.astype(np.float32))
+            starfield.twinkle_changed = False
+
+    def draw(self, alpha=1.0):
+        self.sync()
+        if not len(self.starfield):
+            return
+        self.program["pixel_ratio"] = arcade.get_window().get_pixel_ratio()
+        self.program["alpha"] = alpha
+        with self.ctx.enabled(self.ctx.BLEND, self.ctx.PROGRAM_POINT_SIZE):
+            self.geometry.render(
+                self.program, vertices=len(self.starfield), instances=2
+            )
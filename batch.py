@@ -0,0 +1,143 @@
+"""Play many seeded games without a window, spread over every CPU core.
+
+Run from the project root with ``python batch.py --episodes 1000``. Each
+worker process builds one :class:`Simulation` when it starts and resets it
+between episodes, so textures are loaded once per process, not per game.
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+# Nothing here opens a window, so don't let pyglet go looking for a display.
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+from headless import random_policy
+from simulation import STARTING_LIVES, TICK_RATE, Simulation
+
+DEFAULT_MAX_TICKS = 60 * TICK_RATE  # a minute of play per episode
+
+
+class EpisodeResult(NamedTuple):
+    seed: int
+    score: int
+    lives_lost: int
+    ticks: int
+    aliens_killed: int
+    game_over: bool
+
+
+# The worker process's own simulation, built once by _init_worker.
+_simulation = None
+
+
+def _init_worker(tick_rate):
+    global _simulation
+    _simulation = Simulation(tick_rate=tick_rate)
+
+
+def play_episode(seed, policy_factory=random_policy, max_ticks=DEFAULT_MAX_TICKS):
+    """Play one game in this worker, with the policy ``policy_factory`` makes
+    from a ``random.Random(seed)``. The game ends at game over or after
+    ``max_ticks`` ticks, whichever comes first."""
+    simulation = _simulation
+    simulation.reset()
+    policy = policy_factory(random.Random(seed))
+    step = simulation.step
+    while simulation.ticks < max_ticks and step(policy(simulation)):
+        pass
+    return EpisodeResult(
+        seed=seed,
+        score=simulation.score,
+        lives_lost=STARTING_LIVES - simulation.lives,
+        ticks=simulation.ticks,
+        aliens_killed=simulation.aliens_killed,
+        game_over=simulation.game_over,
+    )
+
+
+def run_batch(
+    seeds,
+    policy_factory=random_policy,
+    max_ticks=DEFAULT_MAX_TICKS,
+    workers=None,
+    tick_rate=TICK_RATE,
+):
+    """Play one episode per seed across ``workers`` processes (one per core by
+    default), yielding each :class:`EpisodeResult` as soon as it finishes.
+
+    ``policy_factory`` is sent to the workers, so it must be picklable: a
+    module-level function or class, not a lambda or closure.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(tick_rate,),
+    ) as executor:
+        futures = [
+            executor.submit(play_episode, seed, policy_factory, max_ticks)
+            for seed in seeds
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def summarize(results):
+    results = list(results)
+    count = len(results)
+    if not count:
+        return {"episodes": 0}
+    scores = [result.score for result in results]
+    return {
+        "episodes": count,
+        "mean_score": sum(scores) / count,
+        "min_score": min(scores),
+        "max_score": max(scores),
+        "mean_ticks": sum(result.ticks for result in results) / count,
+        "mean_lives_lost": sum(result.lives_lost for result in results) / count,
+        "aliens_killed": sum(result.aliens_killed for result in results),
+        "games_over": sum(result.game_over for result in results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--episodes", type=int, default=100)
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE)
+    parser.add_argument(
+        "--verbose", action="store_true", help="print every episode as it ends"
+    )
+    args = parser.parse_args()
+
+    seeds = range(args.first_seed, args.first_seed + args.episodes)
+    results = []
+    start = time.perf_counter()
+    for result in run_batch(
+        seeds, random_policy, args.max_ticks, args.workers, args.tick_rate
+    ):
+        results.append(result)
+        if args.verbose:
+            print(
+                f"seed {result.seed}: score {result.score},"
+                f" {result.ticks} ticks, {result.aliens_killed} kills"
+            )
+    elapsed = time.perf_counter() - start
+
+    for name, value in summarize(results).items():
+        value = f"{value:,.1f}" if isinstance(value, float) else f"{value:,}"
+        print(f"{name:>16}: {value}")
+    ticks = sum(result.ticks for result in results)
+    print(
+        f"{len(results) / elapsed:,.1f} episodes/s, {ticks / elapsed:,.0f} ticks/s"
+        f" on {args.workers or os.cpu_count()} workers"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Laser/ship-vs-alien collision cost: brute force against the SpatialGrid and
+the batched NumPy kernel.
+
+Run from the project root with ``python -m benchmarks.bench_collision``.
+"""
+
+import random
+import time
+
+import arcade
+
+from arcadex.collision import SpatialGrid, collide_batched
+
+ALIEN_COUNTS = (20, 100, 500, 1_000, 5_000)
+LASERS = 12
+FRAMES = 20
+WIDTH = 1440
+HEIGHT = 1960
+
+
+def make_sprites(count, filename, scale, rng, angle=0):
+    texture = arcade.load_texture(filename)
+    sprites = []
+    for _ in range(count):
+        sprite = arcade.Sprite(texture, scale)
+        sprite.angle = angle
+        sprite.position = (rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT))
+        sprites.append(sprite)
+    return sprites
+
+
+def brute_force(shooters, aliens):
+    # What GameWindow did before the grid: every shooter against every alien.
+    return [
+        [alien for alien in aliens if arcade.check_for_collision(shooter, alien)]
+        for shooter in shooters
+    ]
+
+
+def gridded(grid, shooters, aliens):
+    grid.rebuild(aliens)
+    return [grid.collisions(shooter) for shooter in shooters]
+
+
+def batched(shooters, aliens):
+    hits = [[] for _ in shooters]
+    index = {shooter: i for i, shooter in enumerate(shooters)}
+    for shooter, alien in collide_batched(shooters, aliens):
+        hits[index[shooter]].append(alien)
+    return hits
+
+
+def time_frames(detect):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        hits = detect()
+    return (time.perf_counter() - start) / FRAMES, hits
+
+
+def main():
+    rng = random.Random(0)
+    ship = make_sprites(
+        1, ":resources:images/space_shooter/playerShip1_orange.png", 1.0, rng
+    )
+    lasers = make_sprites(
+        LASERS, ":resources:images/space_shooter/laserBlue01.png", 1.0, rng, 270
+    )
+    shooters = lasers + ship
+    grid = SpatialGrid(cell_size=128)
+    print(
+        f"{'aliens':>8} {'brute ms':>10} {'grid ms':>10} {'batched ms':>11} {'hits':>6}"
+    )
+    for count in ALIEN_COUNTS:
+        aliens = make_sprites(count, ":resources:images/enemies/bee.png", 0.8, rng)
+        brute, expected = time_frames(lambda: brute_force(shooters, aliens))
+        fast, hits = time_frames(lambda: gridded(grid, shooters, aliens))
+        assert [set(h) for h in hits] == [set(h) for h in expected]
+        vectorized, batched_hits = time_frames(lambda: batched(shooters, aliens))
+        # Same pairs, in the same order as the per-laser loop found them.
+        assert batched_hits == expected
+        print(
+            f"{count:>8} {brute * 1000:>10.3f} {fast * 1000:>10.3f}"
+            f" {vectorized * 1000:>11.3f} {sum(map(len, hits)):>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
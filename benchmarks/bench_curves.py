@@ -0,0 +1,93 @@
+"""Bezier actions with precomputed curves compared with the old one that
+worked its coefficients out on every step, and what arc-length tables,
+shared paths and batching cost or save on top.
+
+Run from the project root with ``python -m benchmarks.bench_curves``.
+"""
+
+import os
+import time
+
+# Nothing here opens a window, so don't let pyglet go looking for a display.
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import arcade
+
+from actions.base import IntervalAction
+from actions.curves import Path
+from actions.interval import Bezier, FollowPath
+from actions.manager import ActionManager
+
+SPRITES = 10_000
+STEPS = 30
+CONTROL_POINTS = [(0, 0), (50, 300), (250, 300), (300, 0)]
+WAYPOINTS = [(0, 0), (200, 400), (600, 300), (700, 900), (100, 1200), (400, 1500)]
+
+
+class LegacyBezier(IntervalAction):
+    # Bezier as it was before actions.curves.
+    def __init__(self, bezier, duration=5):
+        super().__init__(duration)
+        self.bezier = bezier
+
+    def start(self):
+        self.start_position = (self.target.center_x, self.target.center_y)
+
+    def update(self, t):
+        p = self._bezier_at(t)
+        self.target.center_x = self.start_position[0] + p[0]
+        self.target.center_y = self.start_position[1] + p[1]
+
+    def _bezier_at(self, t):
+        cx = 3 * (self.bezier[1][0] - self.bezier[0][0])
+        bx = 3 * (self.bezier[2][0] - self.bezier[1][0]) - cx
+        ax = self.bezier[3][0] - self.bezier[0][0] - cx - bx
+        cy = 3 * (self.bezier[1][1] - self.bezier[0][1])
+        by = 3 * (self.bezier[2][1] - self.bezier[1][1]) - cy
+        ay = self.bezier[3][1] - self.bezier[0][1] - cy - by
+
+        x = ax * (t**3) + bx * (t**2) + cx * t + self.bezier[0][0]
+        y = ay * (t**3) + by * (t**2) + cy * t + self.bezier[0][1]
+        return (x, y)
+
+
+def time_steps(make_action, staggered=True, batched=False):
+    """Microseconds per action step. Staggered sprites are each at their own
+    point on the path; the rest fly it in formation."""
+    manager = ActionManager(batched=batched)
+    for index in range(SPRITES):
+        action = manager.add(make_action(), arcade.Sprite())
+        if staggered:
+            action._elapsed = index / SPRITES
+    manager.update(1 / 60)  # warm up
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        manager.update(1 / 60)
+    return (time.perf_counter() - start) / (STEPS * SPRITES) * 1e6
+
+
+def main():
+    flight = Path.through(WAYPOINTS)
+    cases = [
+        ("legacy Bezier", lambda: LegacyBezier(CONTROL_POINTS, 10)),
+        ("Bezier", lambda: Bezier(CONTROL_POINTS, 10)),
+        (
+            "Bezier, constant speed",
+            lambda: Bezier(CONTROL_POINTS, 10, constant_speed=True),
+        ),
+        ("flight path (5 segments)", lambda: FollowPath(flight, 10)),
+    ]
+    print(f"{SPRITES} sprites, us per action step")
+    print(f"{'':<26} {'staggered':>10} {'formation':>10} {'batched':>10}")
+    for name, make_action in cases:
+        staggered = time_steps(make_action)
+        formation = time_steps(make_action, staggered=False)
+        if name.startswith("legacy"):
+            print(f"{name:<26} {staggered:>10.3f} {formation:>10.3f} {'-':>10}")
+            continue
+        batched = time_steps(make_action, batched=True)
+        print(f"{name:<26} {staggered:>10.3f} {formation:>10.3f} {batched:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Per-frame HUD cost: a new arcade.Text for the score every frame against
+the persistent Hud, with the score changing now and then or not at all.
+
+Needs an OpenGL context. Run from the project root with
+``python -m benchmarks.bench_hud``.
+"""
+
+import time
+
+import arcade
+
+from hud import Hud
+
+FRAMES = 600
+WIDTH = 1440
+HEIGHT = 1960
+
+
+def draw_rebuilt(window, life_icons, score):
+    # What GameWindow.on_draw did before the Hud: build and lay out the score
+    # text from scratch on every frame. The life icons were already kept.
+    score_text = arcade.Text(
+        text=f"SCORE: {score}",
+        x=window.width - 200,
+        y=window.height - 30,
+        color=arcade.color.WHITE,
+        font_size=18,
+    )
+    score_text.draw()
+    life_icons.draw()
+
+
+def time_frames(window, draw, scores):
+    window.ctx.finish()
+    start = time.perf_counter()
+    for score in scores:
+        draw(score)
+    window.ctx.finish()
+    return (time.perf_counter() - start) / len(scores)
+
+
+def main():
+    window = arcade.Window(WIDTH, HEIGHT, "HUD benchmark", visible=False)
+    hud = Hud(WIDTH, HEIGHT)
+
+    def draw_hud(score):
+        hud.update(score, 3, False)
+        hud.draw()
+
+    print(f"{'score':>22} {'rebuilt us':>11} {'Hud us':>11}")
+    cases = (
+        ("unchanged", [1000] * FRAMES),
+        ("changes every 30", [frame // 30 * 100 for frame in range(FRAMES)]),
+        ("changes every frame", [frame * 100 for frame in range(FRAMES)]),
+    )
+    for name, scores in cases:
+        rebuilt = time_frames(
+            window, lambda score: draw_rebuilt(window, hud.life_icons, score), scores
+        )
+        persistent = time_frames(window, draw_hud, scores)
+        print(f"{name:>22} {rebuilt * 1e6:>11.1f} {persistent * 1e6:>11.1f}")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
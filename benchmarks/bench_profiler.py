@@ -0,0 +1,58 @@
+"""What the frame profiler costs: a bare lap call enabled and disabled, and
+simulation ticks with the profiler off against on.
+
+Run from the project root with ``python -m benchmarks.bench_profiler``.
+"""
+
+import os
+import random
+import time
+
+# Nothing here opens a window, so don't let pyglet go looking for a display.
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+from arcadex.profiler import FrameProfiler
+from simulation import Inputs, Simulation
+
+LAPS = 200_000
+TICKS = 3_000
+
+
+def time_laps(profiler):
+    profiler.frame()
+    start = time.perf_counter()
+    for _ in range(LAPS):
+        profiler.lap("phase")
+    return (time.perf_counter() - start) / LAPS
+
+
+def time_ticks(simulation, enabled):
+    rng = random.Random(0)
+    inputs = [
+        Inputs(rng.random() < 0.3, rng.random() < 0.3, rng.random() < 0.5)
+        for _ in range(TICKS)
+    ]
+    simulation.profiler = FrameProfiler(enabled=enabled)
+    simulation.reset()
+    start = time.perf_counter()
+    for tick in inputs:
+        simulation.profiler.frame()
+        if not simulation.step(tick):
+            simulation.reset()
+    return (time.perf_counter() - start) / TICKS
+
+
+def main():
+    print(f"{'':>22} {'disabled us':>12} {'enabled us':>11}")
+    disabled = time_laps(FrameProfiler())
+    enabled = time_laps(FrameProfiler(enabled=True))
+    print(f"{'lap()':>22} {disabled * 1e6:>12.3f} {enabled * 1e6:>11.3f}")
+    simulation = Simulation()
+    time_ticks(simulation, False)  # warm up
+    disabled = time_ticks(simulation, False)
+    enabled = time_ticks(simulation, True)
+    print(f"{'Simulation tick':>22} {disabled * 1e6:>12.1f} {enabled * 1e6:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Capture and restore cost of Simulation and Starfield snapshots, next to
+building a fresh Simulation, the old way back to a known state.
+
+Run from the project root with ``python -m benchmarks.bench_snapshot``.
+"""
+
+import random
+import time
+
+from arcadex.starfield import Starfield
+from simulation import Inputs, Simulation
+
+ROUNDS = 1_000
+WARMUP_TICKS = 600
+REPLAYED_TICKS = 600
+
+
+def per_call(function, rounds=ROUNDS):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - start) / rounds
+
+
+def fingerprint(simulation):
+    return (
+        simulation.ticks,
+        simulation.score,
+        simulation.lives,
+        simulation.ship_sprite.position,
+        [laser.position for laser in simulation.lasers],
+        [(alien.position, alien.pattern_timer) for alien in simulation.aliens],
+    )
+
+
+def play(simulation, inputs):
+    # The state after every tick: a difference can wash out by the end, as
+    # a laser that stalls can still be gone by then.
+    states = []
+    for tick in inputs:
+        simulation.step(tick)
+        states.append(fingerprint(simulation))
+    return states
+
+
+def main():
+    rng = random.Random(0)
+    inputs = [
+        Inputs(rng.random() < 0.3, rng.random() < 0.3, rng.random() < 0.5)
+        for _ in range(WARMUP_TICKS + REPLAYED_TICKS)
+    ]
+    simulation = Simulation()
+    for tick in inputs[:WARMUP_TICKS]:
+        simulation.step(tick)
+    saved = simulation.snapshot()
+
+    # Playing on from a restored snapshot has to match playing on directly.
+    expected = play(simulation, inputs[WARMUP_TICKS:])
+    simulation.restore(saved)
+    assert play(simulation, inputs[WARMUP_TICKS:]) == expected
+    # So does restoring into another Simulation, such as a copy in another
+    # process, whose sprites have never been in play.
+    copy = Simulation()
+    copy.restore(saved)
+    assert play(copy, inputs[WARMUP_TICKS:]) == expected
+    # And a game played after a reset saves the same bytes as one played in
+    # a new Simulation, whatever the games before it left in the pools.
+    simulation.reset()
+    for tick in inputs[:WARMUP_TICKS]:
+        simulation.step(tick)
+    assert simulation.snapshot() == saved
+
+    starfield = Starfield(1440, 1960, seed=0)
+    for _ in range(WARMUP_TICKS):
+        starfield.update()
+    stars = starfield.snapshot()
+
+    print(f"{'':>22} {'bytes':>8} {'capture us':>11} {'restore us':>11}")
+    rows = (
+        ("Simulation", saved, simulation),
+        ("Starfield", stars, starfield),
+    )
+    for name, data, target in rows:
+        capture = per_call(target.snapshot)
+        restore = per_call(lambda: target.restore(data))  # noqa: B023
+        print(
+            f"{name:>22} {len(data):>8,} {capture * 1e6:>11.1f} {restore * 1e6:>11.1f}"
+        )
+    rebuild = per_call(Simulation, rounds=20)
+    print(f"{'new Simulation()':>22} {'':>8} {'':>11} {rebuild * 1e6:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Request/release churn on SpritePool compared with the old list-scanning pool.
+
+Run from the project root with ``python -m benchmarks.bench_sprite_pool``.
+"""
+
+import random
+import time
+
+import arcade
+
+from arcadex.collections import SpritePool
+
+POOL_SIZES = (100, 1_000, 10_000)
+ROUNDS = 20
+
+
+class LegacySpritePool:
+    # The pool GameWindow used before the free-list version.
+    def __init__(self, sprites):
+        self.sprites = sprites
+        self.active_status = [False] * len(sprites)
+        self.sprite_list = arcade.SpriteList()
+
+    def request_sprite(self):
+        for index, status in enumerate(self.active_status):
+            if not status:
+                self.active_status[index] = True
+                self.sprite_list.append(self.sprites[index])
+                return self.sprites[index]
+        return None
+
+    def deactivate_sprite(self, sprite):
+        if sprite in self.sprites:
+            index = self.sprites.index(sprite)
+            if self.active_status[index]:
+                self.active_status[index] = False
+                self.sprite_list.remove(sprite)
+
+    def get_active_sprites(self):
+        return [
+            sprite for sprite, active in zip(self.sprites, self.active_status) if active
+        ]
+
+
+def churn(pool, size, rng):
+    # Fill the pool, then repeatedly free a random half and refill it, walking
+    # the active sprites each round the way GameWindow.on_update does.
+    for _ in range(size):
+        pool.request_sprite()
+    operations = size
+    for _ in range(ROUNDS):
+        active = pool.get_active_sprites()
+        for sprite in rng.sample(active, len(active) // 2):
+            pool.deactivate_sprite(sprite)
+        operations += len(active) // 2
+        while pool.request_sprite() is not None:
+            operations += 1
+    return operations
+
+
+def time_churn(pool_type, size):
+    pool = pool_type([arcade.Sprite() for _ in range(size)])
+    start = time.perf_counter()
+    operations = churn(pool, size, random.Random(0))
+    return (time.perf_counter() - start) / operations
+
+
+def main():
+    print(f"{'pool size':>10} {'legacy us/op':>14} {'SpritePool us/op':>18}")
+    for size in POOL_SIZES:
+        # The legacy pool is quadratic; keep its largest run bearable.
+        legacy = time_churn(LegacySpritePool, size) if size <= 1_000 else None
+        pooled = time_churn(SpritePool, size)
+        legacy_text = f"{legacy * 1e6:>14.2f}" if legacy is not None else f"{'-':>14}"
+        print(f"{size:>10} {legacy_text} {pooled * 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
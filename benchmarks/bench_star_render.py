@@ -0,0 +1,66 @@
+"""Compare per-star immediate-mode circles with the instanced StarfieldRenderer.
+
+Needs an OpenGL context. Run from the project root with
+``python -m benchmarks.bench_star_render``.
+"""
+
+import time
+
+import arcade
+
+from arcadex.starfield import (
+    STAR_DENSITY,
+    TWINKLE_COLORS,
+    Starfield,
+    StarfieldRenderer,
+)
+
+FRAMES = 60
+STAR_COUNTS = (1_000, 10_000, 100_000)
+WIDTH = 1000
+
+
+def draw_immediate(starfield):
+    # What GameWindow did before StarfieldRenderer: one or two
+    # draw_circle_filled calls per star.
+    for x, y, size, color in zip(
+        starfield.x.tolist(),
+        starfield.y.tolist(),
+        starfield.size.tolist(),
+        starfield.twinkle_color.tolist(),
+    ):
+        arcade.draw_circle_filled(x, y, size, arcade.color.WHITE)
+        if color:
+            arcade.draw_circle_filled(
+                x + size * 1.2, y, size * 0.8, TWINKLE_COLORS[color]
+            )
+
+
+def time_frames(window, starfield, draw):
+    window.ctx.finish()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        starfield.update()
+        window.clear()
+        draw()
+    window.ctx.finish()
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main():
+    window = arcade.Window(WIDTH, 800, "Star render benchmark", visible=False)
+    print(f"{'stars':>8} {'immediate ms':>14} {'instanced ms':>14} {'speedup':>8}")
+    for count in STAR_COUNTS:
+        starfield = Starfield(WIDTH, count * STAR_DENSITY // WIDTH, seed=0)
+        renderer = StarfieldRenderer(starfield, window.ctx)
+        immediate = time_frames(window, starfield, lambda: draw_immediate(starfield))
+        instanced = time_frames(window, starfield, renderer.draw)
+        print(
+            f"{len(starfield):>8} {immediate * 1000:>14.3f} {instanced * 1000:>14.3f}"
+            f" {immediate / instanced:>7.1f}x"
+        )
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare the array-backed Starfield against the old one-object-per-star loop,
+and time incremental resizes against regenerating the whole field.
+
+Run from the project root with ``python -m benchmarks.bench_starfield``.
+"""
+
+import random
+import time
+
+import arcade
+
+from arcadex.starfield import STAR_DENSITY, Starfield
+
+FRAMES = 120
+STAR_COUNTS = (1_000, 10_000, 100_000)
+WIDTH = 1000
+
+
+class Star:
+    # The per-object implementation GameWindow used before Starfield.
+    def __init__(self, x, y, size, speed):
+        self.x = x
+        self.y = y
+        self.size = size
+        self.speed = speed
+        self.twinkling = False
+        self.twinkle_color = None
+        self.twinkle_duration = 0
+
+    def update(self, window_height):
+        self.y -= self.speed
+        if self.y < 0:
+            self.y = window_height
+
+        if self.twinkling:
+            self.twinkle_duration -= 1
+            if self.twinkle_duration <= 0:
+                self.twinkling = False
+                self.twinkle_color = None
+        elif random.random() < 0.001:
+            self.twinkling = True
+            self.twinkle_color = random.choice([arcade.color.RED, arcade.color.BLUE])
+            self.twinkle_duration = random.randint(30, 90)
+
+
+def legacy_stars(width, height):
+    return [
+        Star(
+            random.randint(0, width),
+            random.randint(0, height),
+            random.uniform(1, 3),
+            random.uniform(0.5, 2),
+        )
+        for _ in range(int((width * height) / STAR_DENSITY))
+    ]
+
+
+def time_frames(update):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        update()
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main():
+    random.seed(0)
+    print(f"{'stars':>8} {'Star loop ms':>14} {'Starfield ms':>14} {'speedup':>8}")
+    for count in STAR_COUNTS:
+        height = count * STAR_DENSITY // WIDTH
+
+        stars = legacy_stars(WIDTH, height)
+
+        def legacy_update():
+            for star in stars:
+                star.update(height)
+
+        starfield = Starfield(WIDTH, height, seed=0)
+        legacy = time_frames(legacy_update)
+        batched = time_frames(starfield.update)
+        print(
+            f"{len(starfield):>8} {legacy * 1000:>14.3f} {batched * 1000:>14.3f}"
+            f" {legacy / batched:>7.1f}x"
+        )
+
+    print()
+    print(f"{'stars':>8} {'regenerate ms':>14} {'+1% resize ms':>14}")
+    for count in STAR_COUNTS:
+        height = count * STAR_DENSITY // WIDTH
+        start = time.perf_counter()
+        starfield = Starfield(WIDTH, height, seed=0)
+        regenerate = time.perf_counter() - start
+        start = time.perf_counter()
+        starfield.resize(WIDTH, height * 101 // 100)
+        resize = time.perf_counter() - start
+        print(f"{count:>8} {regenerate * 1000:>14.3f} {resize * 1000:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Cold start: how long a fresh process takes to get the first frame's
+assets and all of them, loading one after another as ``setup()`` used to
+against preloading on worker threads, and, where there's a display, how long
+the game takes from process start to its first frame of play.
+
+Every measurement is a new process, so nothing is cached between them. Run
+from the project root with ``python -m benchmarks.bench_startup``.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROUNDS = 5
+
+
+def load_assets(mode):
+    # Runs in the child process: report when the assets arrive, in seconds
+    # from the start of loading, as one line of JSON.
+    os.environ.setdefault("ARCADE_HEADLESS", "1")
+    from arcadex.assets import assets
+    from megamania import FIRST_FRAME_ASSETS, GAME_ASSETS
+
+    start = time.perf_counter()
+    if mode == "sequential":
+        load = {
+            "texture": assets.texture,
+            "grid": assets.texture_grid,
+            "sound": assets.sound,
+        }
+        for kind, *args in GAME_ASSETS:
+            load[kind](*args)
+        first_frame = all_loaded = time.perf_counter() - start
+    else:
+        preload = assets.preload(GAME_ASSETS)
+        while not preload.ready(FIRST_FRAME_ASSETS):
+            time.sleep(0.001)
+        first_frame = time.perf_counter() - start
+        preload.wait()
+        all_loaded = time.perf_counter() - start
+    print(json.dumps({"first_frame": first_frame, "all_loaded": all_loaded}))
+
+
+def run_child(mode):
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", mode],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output.splitlines()[-1])
+    result["process"] = time.perf_counter() - start
+    return result
+
+
+def time_game():
+    # From spawning the game to it printing its first frame of play; None
+    # when there's no display to open the window on.
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            [sys.executable, "megamania.py", "--startup-time"],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0 or "startup" not in completed.stdout:
+        return None
+    return elapsed
+
+
+def main():
+    if len(sys.argv) > 1:
+        load_assets(sys.argv[1])
+        return
+
+    print(f"{'':>12} {'first frame ms':>15} {'all assets ms':>14} {'process ms':>11}")
+    for mode in ("sequential", "threaded"):
+        results = [run_child(mode) for _ in range(ROUNDS)]
+        first_frame, all_loaded, process = (
+            statistics.median(result[name] for result in results)
+            for name in ("first_frame", "all_loaded", "process")
+        )
+        print(
+            f"{mode:>12} {first_frame * 1000:>15.1f} {all_loaded * 1000:>14.1f}"
+            f" {process * 1000:>11.1f}"
+        )
+
+    game = [time_game() for _ in range(ROUNDS)]
+    if None in game:
+        print("game startup: skipped, no display to open a window on")
+    else:
+        print(f"game startup to first frame of play: {statistics.median(game):.3f} s")
+
+
+if __name__ == "__main__":
+    main()
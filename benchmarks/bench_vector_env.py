@@ -0,0 +1,82 @@
+"""Per-game tick cost of VectorEnv at several batch sizes, against stepping
+one sprite-based Simulation.
+
+Run from the project root with ``python -m benchmarks.bench_vector_env``.
+"""
+
+import time
+
+import numpy as np
+
+from simulation import Inputs, Simulation
+from vector_env import VectorEnv
+
+BATCH_SIZES = (1, 64, 1_024, 4_096)
+TICKS = 600
+CHECKED_GAMES = 8
+
+
+def random_actions(rng, games, ticks):
+    return rng.random((ticks, games, 3)) < (0.3, 0.3, 0.5)
+
+
+def time_simulation(actions):
+    simulation = Simulation()
+    start = time.perf_counter()
+    for left, right, fire in actions[:, 0]:
+        if not simulation.step(Inputs(left, right, fire)):
+            simulation.reset()
+    return (time.perf_counter() - start) / len(actions)
+
+
+def time_vector_env(games, actions):
+    env = VectorEnv(games)
+    env.reset()
+    start = time.perf_counter()
+    for tick in actions:
+        env.step(tick)
+    return (time.perf_counter() - start) / len(actions)
+
+
+def final_scores(games, actions):
+    # Scores of the first game each row finishes, from both implementations.
+    env = VectorEnv(games)
+    env.reset()
+    vector = [None] * games
+    for tick in actions:
+        _, _, dones = env.step(tick)
+        for game in np.flatnonzero(dones):
+            if vector[game] is None:
+                vector[game] = int(env.final_scores[game])
+    simulation = Simulation()
+    expected = []
+    for game in range(games):
+        simulation.reset()
+        for left, right, fire in actions[:, game]:
+            if not simulation.step(Inputs(left, right, fire)):
+                break
+        expected.append(simulation.score if simulation.game_over else None)
+    return vector, expected
+
+
+def main():
+    rng = np.random.default_rng(0)
+    checked = random_actions(rng, CHECKED_GAMES, 3_000)
+    vector, expected = final_scores(CHECKED_GAMES, checked)
+    assert vector == expected, (vector, expected)
+
+    actions = random_actions(rng, max(BATCH_SIZES), TICKS)
+    single = time_simulation(actions)
+    print(f"Simulation.step: {single * 1e6:.1f} us per game tick")
+    print(f"{'games':>8} {'tick ms':>10} {'us/game':>10} {'vs Simulation':>14}")
+    for games in BATCH_SIZES:
+        tick = time_vector_env(games, actions[:, :games])
+        per_game = tick / games
+        print(
+            f"{games:>8} {tick * 1000:>10.3f} {per_game * 1e6:>10.2f}"
+            f" {per_game / single:>13.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
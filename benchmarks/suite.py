@@ -0,0 +1,376 @@
+"""The benchmark suite: every hot path the game leans on, timed headless and
+compared with a stored baseline.
+
+Run from the project root with ``python -m benchmarks.suite``. Results go to
+``benchmarks/results.json``, and each case's best time per unit of work is
+compared with ``benchmarks/baseline.json``; changes beyond ``--threshold``
+are flagged, and ``--fail`` turns a slowdown into a non-zero exit for CI.
+``--save-baseline`` makes this run the new baseline, which only means
+something on the machine it'll be compared on. ``--filter`` runs just the
+cases whose names contain the given text.
+
+Each case runs a round of work once to warm up and then ``--repeats`` more
+times with the garbage collector off. State a round changes (pools, games,
+positions) is put back between rounds, outside the timing, so every round
+does the same work from the same seeds. The fastest round is the one
+compared, as noise from the rest of the machine only ever adds time.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+# Nothing here opens a window, so don't let pyglet go looking for a display.
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import arcade
+import numpy as np
+
+from actions.base import Repeat
+from actions.interval import Bezier, FadeTo, MoveBy, RotateBy
+from actions.manager import ActionManager
+from arcadex.assets import assets
+from arcadex.collections import SpritePool
+from arcadex.collision import SpatialGrid, collide_batched
+from arcadex.interpolation import Interpolator
+from arcadex.starfield import Starfield
+from benchmarks.bench_collision import make_sprites
+from benchmarks.bench_sprite_pool import churn
+from simulation import (
+    ALIEN_START_DELAY,
+    LASER_IMAGE,
+    LASER_SCALE,
+    MAX_LASERS,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    Inputs,
+    Laser,
+    Simulation,
+)
+
+BENCHMARKS = Path(__file__).parent
+RESULTS_PATH = BENCHMARKS / "results.json"
+BASELINE_PATH = BENCHMARKS / "baseline.json"
+THRESHOLD = 0.15  # relative change in best time that counts as a change
+REPEATS = 5
+
+POOL_SIZES = (100, 1_000, 10_000)
+UPDATE_SCALES = (1, 4, 16)
+UPDATE_TICKS = 60
+COLLISION_ALIENS = (100, 1_000, 5_000)
+COLLISION_FRAMES = 20
+ACTION_COUNTS = (1_000, 10_000, 100_000)
+# Long enough that no action finishes while it's being timed.
+ACTION_DURATION = 1e6
+ACTION_STEPS = 3
+
+
+class Workload(NamedTuple):
+    run: Callable[[], int]  # one round of work; returns how many units it did
+    reset: Optional[Callable[[], None]] = None  # untimed, before every round
+
+
+class Case(NamedTuple):
+    name: str
+    unit: str
+    make: Callable[[], Workload]
+
+
+def pool_churn(size):
+    pool = None
+
+    def reset():
+        nonlocal pool
+        pool = SpritePool([arcade.Sprite() for _ in range(size)])
+
+    def run():
+        return churn(pool, size, random.Random(0))
+
+    return Workload(run, reset)
+
+
+def game_update(scale):
+    # What GameWindow.on_update does each tick, with scale times the aliens,
+    # lasers and stars of a normal game on screen.
+    rng = random.Random(scale)
+    simulation = Simulation()
+    simulation.lives = 2**30  # so the round can't end in a game over
+    simulation.start_time = -ALIEN_START_DELAY  # the aliens are already moving
+    for _ in range(simulation.aliens.stats()["size"], 20 * scale):
+        alien = simulation.aliens.request_sprite()
+        alien.reset(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+    laser_texture = assets.texture(LASER_IMAGE)
+    simulation.lasers = SpritePool(
+        [Laser(laser_texture, LASER_SCALE) for _ in range(MAX_LASERS * scale)]
+    )
+    for _ in range(MAX_LASERS * scale):
+        simulation.lasers.request_sprite().reset(
+            rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)
+        )
+    starfield = Starfield(SCREEN_WIDTH * scale, SCREEN_HEIGHT, seed=scale)
+    interpolator = Interpolator()
+    sprites = (simulation.ship_list, simulation.lasers, simulation.aliens)
+    inputs = [Inputs(rng.random() < 0.3, rng.random() < 0.3) for _ in range(60)]
+    saved_game = simulation.snapshot()
+    saved_stars = starfield.snapshot()
+
+    def reset():
+        simulation.restore(saved_game)
+        starfield.restore(saved_stars)
+
+    def run():
+        for tick in range(UPDATE_TICKS):
+            interpolator.capture(sprites)
+            starfield.update()
+            simulation.step(inputs[tick % len(inputs)])
+        return UPDATE_TICKS
+
+    return Workload(run, reset)
+
+
+def collision(kind, count):
+    rng = random.Random(0)
+    aliens = make_sprites(count, ":resources:images/enemies/bee.png", 0.8, rng)
+    shooters = make_sprites(
+        MAX_LASERS, ":resources:images/space_shooter/laserBlue01.png", 1.0, rng, 270
+    )
+    grid = SpatialGrid(cell_size=128)
+
+    def run():
+        for _ in range(COLLISION_FRAMES):
+            if kind == "grid":
+                grid.rebuild(aliens)
+                for shooter in shooters:
+                    grid.collisions(shooter)
+            else:
+                list(collide_batched(shooters, aliens))
+        return COLLISION_FRAMES
+
+    return Workload(run)
+
+
+_ACTION_KINDS = {
+    "Sequence": lambda: (
+        MoveBy((10, 5), ACTION_DURATION) + RotateBy(90, ACTION_DURATION)
+    ),
+    "Spawn": lambda: MoveBy((10, 5), ACTION_DURATION) | FadeTo(0, ACTION_DURATION),
+    "Loop": lambda: MoveBy((10, 5), ACTION_DURATION) * 3,
+    "Repeat": lambda: Repeat(MoveBy((10, 5), ACTION_DURATION)),
+    "Bezier": lambda: Bezier(
+        [(0, 0), (50, 100), (150, 100), (200, 0)], ACTION_DURATION
+    ),
+}
+_targets = []
+
+
+def action_step(kind, count):
+    # Sprites are shared between cases: making 100k of them costs far more
+    # than any round here.
+    _targets.extend(arcade.Sprite() for _ in range(count - len(_targets)))
+    targets = _targets[:count]
+    actions = []
+
+    def reset():
+        actions.clear()
+        for target in targets:
+            target.position = (0, 0)
+            target.angle = 0
+            target.alpha = 255
+            action = _ACTION_KINDS[kind]()
+            action.target = target
+            action.start()
+            actions.append(action)
+
+    def run():
+        for _ in range(ACTION_STEPS):
+            for action in actions:
+                action.step(1 / 60)
+        return ACTION_STEPS * count
+
+    return Workload(run, reset)
+
+
+def manager_update(count, batched):
+    # The same moves as actions.Spawn and the rest, stepped through an
+    # ActionManager rather than one by one, and with batched in bulk.
+    _targets.extend(arcade.Sprite() for _ in range(count - len(_targets)))
+    targets = _targets[:count]
+    manager = ActionManager(batched=batched)
+
+    def reset():
+        manager.clear()
+        for target in targets:
+            target.position = (0, 0)
+            manager.add(MoveBy((10, 5), ACTION_DURATION), target)
+
+    def run():
+        for _ in range(ACTION_STEPS):
+            manager.update(1 / 60)
+        return ACTION_STEPS * count
+
+    return Workload(run, reset)
+
+
+CASES = [
+    *(
+        Case(f"sprite_pool.churn[{size}]", "op", partial(pool_churn, size))
+        for size in POOL_SIZES
+    ),
+    *(
+        Case(f"update[x{scale}]", "tick", partial(game_update, scale))
+        for scale in UPDATE_SCALES
+    ),
+    *(
+        Case(f"collision.{kind}[{count}]", "frame", partial(collision, kind, count))
+        for kind in ("grid", "batched")
+        for count in COLLISION_ALIENS
+    ),
+    *(
+        Case(f"actions.{kind}[{count}]", "step", partial(action_step, kind, count))
+        for kind in _ACTION_KINDS
+        for count in ACTION_COUNTS
+    ),
+    *(
+        Case(
+            f"actions.manager{'.batched' if batched else ''}[{count}]",
+            "step",
+            partial(manager_update, count, batched),
+        )
+        for batched in (False, True)
+        for count in ACTION_COUNTS
+    ),
+]
+
+
+def time_case(case, repeats):
+    """Seconds per unit of work in each timed round of ``case``."""
+    workload = case.make()
+    timings = []
+    for round_ in range(repeats + 1):
+        if workload.reset is not None:
+            workload.reset()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            units = workload.run()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if round_:  # the first round is a warm-up
+            timings.append(elapsed / units)
+    return timings
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=BENCHMARKS,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "numpy": np.__version__,
+        "arcade": arcade.version.VERSION,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print each case against the baseline; returns the names that slowed
+    down by more than ``threshold``."""
+    slower = []
+    print(f"{'case':<30} {'unit':>6} {'baseline us':>12} {'now us':>10} {'change':>8}")
+    for name, result in results.items():
+        now = result["min_us"]
+        before = baseline.get(name, {}).get("min_us")
+        if before is None:
+            print(f"{name:<30} {result['unit']:>6} {'-':>12} {now:>10.3f} {'new':>8}")
+            continue
+        change = now / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  slower"
+            slower.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        print(
+            f"{name:<30} {result['unit']:>6} {before:>12.3f} {now:>10.3f}"
+            f" {change:>+8.1%}{flag}"
+        )
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument(
+        "--filter", default="", help="only cases whose names contain this"
+    )
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store this run as the baseline"
+    )
+    parser.add_argument(
+        "--fail", action="store_true", help="exit with 1 if any case got slower"
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for case in CASES:
+        if args.filter not in case.name:
+            continue
+        timings = time_case(case, args.repeats)
+        results[case.name] = {
+            "unit": case.unit,
+            "median_us": statistics.median(timings) * 1e6,
+            "min_us": min(timings) * 1e6,
+            "stdev_us": statistics.stdev(timings) * 1e6 if len(timings) > 1 else 0.0,
+            "repeats": len(timings),
+        }
+        print(f"{case.name:<30} {results[case.name]['min_us']:>12.3f} us/{case.unit}")
+
+    report = {"environment": environment(), "results": results}
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.save_baseline:
+        if args.baseline.exists():
+            # Keep the baseline of any case this run filtered out.
+            previous = json.loads(args.baseline.read_text())["results"]
+            report["results"] = {**previous, **results}
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"saved as the baseline in {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --save-baseline to make one")
+        return
+    baseline = json.loads(args.baseline.read_text())
+    print(f"\ncompared with the baseline from {baseline['environment']['commit']}:")
+    slower = compare(results, baseline["results"], args.threshold)
+    if slower and args.fail:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
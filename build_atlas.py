@@ -0,0 +1,51 @@
+"""Pack every texture the game draws into the prebuilt atlas under res/.
+
+Run from the project root with ``python build_atlas.py`` whenever a sprite or
+the explosion spritesheet changes; the game reads the atlas in one go instead
+of decoding each file and computing hit boxes at startup.
+"""
+
+import argparse
+import os
+
+# Only images are needed, so don't let pyglet go looking for a display.
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import arcade
+
+from arcadex.atlas import SpriteAtlas, grid_frame_name
+from simulation import ASSETS, ATLAS_PATH
+
+
+def collect_textures(manifest):
+    """Every texture in ``manifest``, loaded straight from its file."""
+    textures = {}
+    for kind, path, *args in manifest:
+        if kind == "texture":
+            textures[path] = arcade.load_texture(path)
+        elif kind == "grid":
+            size, columns, count = args
+            grid = arcade.load_spritesheet(path).get_texture_grid(
+                size=size, columns=columns, count=count
+            )
+            for index, texture in enumerate(grid):
+                textures[grid_frame_name(path, size, columns, index)] = texture
+    return textures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the sprite atlas.")
+    parser.add_argument("--output", default=ATLAS_PATH, help="where to write it")
+    args = parser.parse_args()
+
+    atlas = SpriteAtlas.build(collect_textures(ASSETS))
+    atlas.save(args.output)
+    width, height = atlas.size
+    print(
+        f"{len(atlas)} textures in {width}x{height},"
+        f" {os.path.getsize(args.output) / 1024:.0f} KiB at {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
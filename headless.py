@@ -0,0 +1,99 @@
+"""Play the game without a window, as fast as the CPU allows.
+
+Run from the project root with ``python headless.py``; it reports how many
+simulation ticks per second this machine manages. ``python headless.py
+--replay game.rpl`` fast-forwards through a recorded game instead and prints
+how it ended.
+"""
+
+import argparse
+import os
+import random
+import time
+
+# Nothing here opens a window, so don't let pyglet go looking for a display.
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+from arcadex.assets import assets, format_report
+from replay import Replay, Replayer
+from simulation import TICK_RATE, Inputs, Simulation
+
+
+def random_policy(rng):
+    def policy(simulation):
+        return Inputs(
+            left=rng.random() < 0.3, right=rng.random() < 0.3, fire=rng.random() < 0.5
+        )
+
+    return policy
+
+
+def run(simulation, policy, ticks):
+    """Step ``simulation`` for ``ticks`` ticks, starting a new game whenever
+    one ends. Returns the final score of every game that finished."""
+    scores = []
+    for _ in range(ticks):
+        if not simulation.step(policy(simulation)):
+            scores.append(simulation.score)
+            simulation.reset()
+    return scores
+
+
+def play_replay(path):
+    start = time.perf_counter()
+    replay = Replay.load(path)
+    loaded = time.perf_counter()
+    replayer = Replayer(replay)
+    replayer.run()
+    done = time.perf_counter()
+
+    simulation = replayer.simulation
+    print(
+        f"{len(replay)} ticks ({len(replay) / replay.tick_rate:.0f} s of play),"
+        f" {len(replay.runs)} input runs, {os.path.getsize(path):,} bytes"
+    )
+    print(
+        f"loaded in {(loaded - start) * 1000:.1f} ms, replayed in {done - loaded:.2f} s"
+    )
+    print(
+        f"score {simulation.score}, lives {simulation.lives},"
+        f" game over: {simulation.game_over}"
+    )
+
+
+def play_random(args):
+    simulation = Simulation(tick_rate=args.tick_rate)
+    policy = random_policy(random.Random(args.seed))
+    start = time.perf_counter()
+    scores = run(simulation, policy, args.ticks)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.ticks} ticks in {elapsed:.2f} s: {args.ticks / elapsed:,.0f} ticks/s")
+    print(f"{args.ticks / args.tick_rate / elapsed:.1f}x real time")
+    if scores:
+        print(
+            f"{len(scores)} games finished, mean score {sum(scores) / len(scores):.0f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE)
+    parser.add_argument("--replay", metavar="PATH", help="replay a recorded game")
+    parser.add_argument(
+        "--assets", action="store_true", help="report what loading assets cost"
+    )
+    args = parser.parse_args()
+
+    if args.replay:
+        play_replay(args.replay)
+    else:
+        play_random(args)
+    if args.assets:
+        print(format_report(assets.report()))
+
+
+if __name__ == "__main__":
+    main()
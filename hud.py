@@ -0,0 +1,107 @@
+import arcade
+
+from arcadex.assets import assets
+from simulation import SHIP_IMAGE, STARTING_LIVES
+
+LIFE_ICON_SCALE = 0.5
+
+
+class Hud:
+    """The score, spare-life icons and game-over messages over the game.
+
+    Every text and sprite is made once. :meth:`update` only touches one when
+    the value it shows has changed, so a HUD that hasn't changed costs no
+    more than its draw calls, and :meth:`resize` moves everything to follow
+    the window's edges.
+    """
+
+    def __init__(self, width, height, lives=STARTING_LIVES):
+        self.score = None
+        self.lives = None
+        self.game_over = False
+        self.score_text = arcade.Text(
+            text="", x=0, y=0, color=arcade.color.WHITE, font_size=18
+        )
+        self.life_icons = arcade.SpriteList()
+        for _ in range(lives):
+            self.life_icons.append(
+                arcade.Sprite(assets.texture(SHIP_IMAGE), LIFE_ICON_SCALE)
+            )
+        self.game_over_text = arcade.Text(
+            text="GAME OVER",
+            x=0,
+            y=0,
+            color=arcade.color.WHITE,
+            font_size=64,
+            anchor_x="center",
+        )
+        self.enter_text = arcade.Text(
+            text="Press ENTER to restart",
+            x=0,
+            y=0,
+            color=arcade.color.WHITE,
+            font_size=32,
+            anchor_x="center",
+        )
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        self.score_text.position = (width - 200, height - 30)
+        for i, life_icon in enumerate(self.life_icons):
+            life_icon.position = (30 + i * 40, height - 30)
+        self.game_over_text.position = (width // 2, height // 2)
+        self.enter_text.position = (width // 2, height // 2 - 64)
+
+    def update(self, score, lives, game_over):
+        if score != self.score:
+            self.score = score
+            self.score_text.text = f"SCORE: {score}"
+        if lives != self.lives:
+            self.lives = lives
+            for i, life_icon in enumerate(self.life_icons):
+                life_icon.visible = i < lives
+        self.game_over = game_over
+
+    def draw(self):
+        self.score_text.draw()
+        self.life_icons.draw()
+        if self.game_over:
+            self.game_over_text.draw()
+            self.enter_text.draw()
+
+
+class LoadingScreen:
+    """A progress bar shown while the game's assets load."""
+
+    BAR_WIDTH = 400
+    BAR_HEIGHT = 16
+
+    def __init__(self, width, height):
+        self.text = arcade.Text(
+            text="LOADING",
+            x=0,
+            y=0,
+            color=arcade.color.WHITE,
+            font_size=24,
+            anchor_x="center",
+        )
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        self.left = (width - self.BAR_WIDTH) // 2
+        self.bottom = height // 2 - self.BAR_HEIGHT
+        self.text.position = (width // 2, height // 2 + 24)
+
+    def draw(self, progress):
+        self.text.draw()
+        if progress > 0:
+            arcade.draw_lbwh_rectangle_filled(
+                self.left,
+                self.bottom,
+                self.BAR_WIDTH * progress,
+                self.BAR_HEIGHT,
+                arcade.color.WHITE,
+            )
+        arcade.draw_lbwh_rectangle_outline(
+            self.left, self.bottom, self.BAR_WIDTH, self.BAR_HEIGHT, arcade.color.WHITE
+        )
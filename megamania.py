@@ -1,368 +1,302 @@
+import argparse
 import random
 import time
 
 import arcade
 
-from collection import SpritePool
+from arcadex.assets import assets
+from arcadex.audio import Mixer
+from arcadex.interpolation import Interpolator
+from arcadex.power import PowerGovernor
+from arcadex.profiler import FrameProfiler, ProfilerOverlay
+from arcadex.starfield import Starfield, StarfieldRenderer
+from hud import Hud, LoadingScreen
+from replay import Replay, Replayer, ReplayRecorder
+from simulation import (
+    ASSETS,
+    EXPLOSION,
+    LASER_FIRED,
+    TICK_RATE,
+    Inputs,
+    Simulation,
+)
+from simulation import FIRST_FRAME_ASSETS as SIMULATION_FIRST_FRAME_ASSETS
 
 SCREEN_WIDTH = 1440
 SCREEN_HEIGHT = 1960
 SCREEN_TITLE = "Space Invaders-style Game"
 
-SHIP_SCALE = 1.0
-SHIP_SPEED = 10
-LASER_SPEED = 20
-LASER_SCALE = 1.0
-ALIEN_SCALE = 0.8
-ALIEN_SPEED = 15
-
-MAX_LASERS = 12
-LASER_COOLDOWN = 0.16
-
-ALIEN_ROWS = 4
-ALIENS_PER_ROW = 5
-ALIEN_HORIZONTAL_SPACING = 400
-ALIEN_VERTICAL_SPACING = SCREEN_HEIGHT * 2 / 3 / (ALIEN_ROWS - 1)
-
-
-class Star:
-    def __init__(self, x, y, size, speed):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.speed = speed
-        self.twinkling = False
-        self.twinkle_color = None
-        self.twinkle_duration = 0
-
-    def update(self, window_height):
-        self.y -= self.speed
-        if self.y < 0:
-            self.y = window_height
-
-        if self.twinkling:
-            self.twinkle_duration -= 1
-            if self.twinkle_duration <= 0:
-                self.twinkling = False
-                self.twinkle_color = None
-        elif random.random() < 0.001:
-            self.twinkling = True
-            self.twinkle_color = random.choice([arcade.color.RED, arcade.color.BLUE])
-            self.twinkle_duration = random.randint(30, 90)
-
-    def draw(self):
-        arcade.draw_circle_filled(self.x, self.y, self.size, arcade.color.WHITE)
-        if self.twinkling:
-            twinkle_x = self.x + self.size * 1.2
-            twinkle_y = self.y
-            arcade.draw_circle_filled(
-                twinkle_x, twinkle_y, self.size * 0.8, self.twinkle_color
-            )
-
-
-class Laser(arcade.Sprite):
-    def __init__(self, filename, scale):
-        super().__init__(filename, scale)
-        self.angle = 270
-        self.is_active = False
-
-    def update(self, delta_time):
-        if self.is_active:
-            self.center_y += LASER_SPEED
-
-    def reset(self, x, y):
-        self.center_x = x
-        self.center_y = y
-        self.is_active = True
-
-
-class Explosion(arcade.Sprite):
-    def __init__(self, texture_list):
-        super().__init__()
-        self.current_texture = 0
-        self.textures = texture_list
-        self.scale = 1.0
-        self.set_texture(self.current_texture)
-
-    def update(self, delta_time):
-        self.current_texture += 1
-        if self.current_texture < len(self.textures):
-            self.set_texture(self.current_texture)
-        else:
-            self.remove_from_sprite_lists()
-
+LASER_SOUND = ":resources:sounds/laser1.wav"
+EXPLOSION_SOUND = ":resources:sounds/explosion1.wav"
+# Below full volume, so sounds merged by the mixer have room to be louder.
+SOUND_VOLUME = 0.6
 
-class Alien(arcade.Sprite):
-    def __init__(self, filename, scale):
-        super().__init__(filename, scale)
-        self.movement_pattern = "diagonal_down"
-        self.pattern_timer = 0
+MAX_CATCH_UP_TICKS = 5  # most ticks a single on_update runs to catch up
 
-    def update(self, delta_time: float = 1 / 60):
-        movement_speed = ALIEN_SPEED
-
-        if self.movement_pattern == "diagonal_down":
-            self.center_x += movement_speed / 2
-            self.center_y -= movement_speed
-        elif self.movement_pattern == "right":
-            self.center_x += movement_speed
-
-        self.pattern_timer += 1
-        if self.pattern_timer >= 120:  # 2 seconds at 60 FPS
-            self.pattern_timer = 0
-            if self.movement_pattern == "diagonal_down":
-                self.movement_pattern = "right"
-            else:
-                self.movement_pattern = "diagonal_down"
-
-        # Wrap around screen edges
-        if self.right < 0:
-            self.left = SCREEN_WIDTH
-        elif self.left > SCREEN_WIDTH:
-            self.right = 0
-        if self.top < 0:
-            self.bottom = SCREEN_HEIGHT
+# Sounds can play from the first tick, so play starts once they're in too.
+FIRST_FRAME_ASSETS = [
+    *SIMULATION_FIRST_FRAME_ASSETS,
+    ("sound", LASER_SOUND),
+    ("sound", EXPLOSION_SOUND),
+]
+GAME_ASSETS = [*FIRST_FRAME_ASSETS, *ASSETS]
 
 
 class GameWindow(arcade.Window):
-    def __init__(self, width, height, title):
+    """Presents a :class:`Simulation`: turns keys into its inputs, steps it at
+    its tick rate, and draws and plays sounds for what happens in it.
+
+    With ``record_path`` each game's inputs are saved there when it ends (or
+    the window closes). With ``replay`` the inputs come from that recording
+    instead of the keyboard, starting from tick ``replay_from``.
+
+    :meth:`start` loads the assets on worker threads behind a progress bar
+    and begins play as soon as those for the first frame are in. The time
+    from ``started`` to the first frame drawn in play is kept as
+    ``startup_time``; with ``quit_when_started`` it's printed and the window
+    closes, for timing startup.
+
+    F3 shows the frame profiler's overlay, timing each phase of
+    :meth:`on_update` and :meth:`on_draw` while it's up. With
+    ``profile_path`` the profiler runs from the start and what it holds is
+    written there when the window closes.
+
+    Once nothing on screen moves (the game is over, or a replay has ended),
+    the window loses the focus or it's minimized, ``power`` drops the draw
+    rate, and on a static screen the update rate too; a key press, the mouse
+    or getting the focus back restores full rate at once. ``throttle=False``
+    keeps full rate throughout, and with ``cpu_report`` the CPU use in each
+    of those states is printed when the window closes.
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        title,
+        tick_rate=TICK_RATE,
+        seed=None,
+        record_path=None,
+        replay=None,
+        replay_from=0,
+        started=None,
+        quit_when_started=False,
+        profile_path=None,
+        throttle=True,
+        cpu_report=False,
+    ):
         super().__init__(width, height, title, resizable=True)
         arcade.set_background_color(arcade.color.BLACK)
-        self.star_list = []
-        self.ship_sprite = None
-        self.ship_list = None
-        self.lasers = None
-        self.active_lasers = None
-        self.alien_list = None
-        self.explosion_list = None
+        if replay is not None:
+            tick_rate = replay.tick_rate
+            seed = replay.seed
+        self.tick_rate = tick_rate
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.record_path = record_path
+        self.recorder = None
+        self.replay = replay
+        self.replay_from = replay_from
+        self.replayer = None
+        self.tick_accumulator = 0.0
+        self.interpolator = Interpolator()
+        self.simulation = None
+        self.starfield = None
+        self.star_renderer = None
         self.left_pressed = False
         self.right_pressed = False
         self.ctrl_pressed = False
         self.laser_sound = None
         self.explosion_sound = None
-        self.last_fire_time = 0
-        self.score = 0
-        self.lives = 3
-        self.game_over = False
-        self.start_time = 0
-        self.life_icon_list = None
-        self.player_exploding = False
-        self.player_explosion_timer = 0
-        self.reset_timer = 0
-        self.explosion_textures = []
-        self.game_over_text = arcade.Text(
-            text="GAME OVER",
-            x=self.width // 2,
-            y=self.height // 2,
-            color=arcade.color.WHITE,
-            font_size=64,
-            anchor_x="center",
-        )
-        self.enter_text = arcade.Text(
-            text="Press ENTER to restart",
-            x=self.width // 2,
-            y=self.height // 2 - 64,
-            color=arcade.color.WHITE,
-            font_size=32,
-            anchor_x="center",
-        )
+        self.mixer = Mixer()
+        self.hud = None
+        self.preload = None
+        self.loading_screen = None
+        self.started = time.perf_counter() if started is None else started
+        self.startup_time = None
+        self.quit_when_started = quit_when_started
+        self.profile_path = profile_path
+        self.profiler = FrameProfiler(enabled=profile_path is not None)
+        self.profiler_overlay = None
+        self.power = PowerGovernor(self, enabled=throttle)
+        self.cpu_report = cpu_report
+
+    def start(self):
+        self.preload = assets.preload(GAME_ASSETS)
+        self.loading_screen = LoadingScreen(self.width, self.height)
 
     def setup(self):
         self.generate_stars()
-        self.ship_sprite = arcade.Sprite(
-            ":resources:images/space_shooter/playerShip1_orange.png", SHIP_SCALE
-        )
-        self.ship_sprite.center_x = self.width // 2
-        self.ship_sprite.center_y = self.ship_sprite.height
-        self.ship_list = arcade.SpriteList()
-        self.ship_list.append(self.ship_sprite)
-
-        self.lasers = SpritePool(
-            [
-                Laser(":resources:images/space_shooter/laserBlue01.png", LASER_SCALE)
-                for _ in range(MAX_LASERS)
-            ]
-        )
-        self.alien_list = arcade.SpriteList()
-        self.explosion_list = arcade.SpriteList()
-        self.create_alien_formation()
-
-        self.laser_sound = arcade.load_sound(":resources:sounds/laser1.wav")
-        self.explosion_sound = arcade.load_sound(":resources:sounds/explosion1.wav")
-
-        self.start_time = time.time()
-        self.score = 0
-        self.lives = 3
-        self.game_over = False
-        self.player_exploding = False
-        self.player_explosion_timer = 0
-        self.reset_timer = 0
-
-        self.life_icon_list = arcade.SpriteList()
-        for i in range(self.lives):
-            life_icon = arcade.Sprite(
-                ":resources:images/space_shooter/playerShip1_orange.png", 0.5
-            )
-            life_icon.center_x = 30 + i * 40
-            life_icon.center_y = self.height - 30
-            self.life_icon_list.append(life_icon)
-
-        # Load explosion textures
-        spritesheet = arcade.load_spritesheet(
-            ":resources:images/spritesheets/explosion.png"
-        )
-        columns = 16
-        count = 60
-        sprite_width = 256
-        sprite_height = 256
-        self.explosion_textures = spritesheet.get_texture_grid(
-            size=(sprite_width, sprite_height), columns=columns, count=count
-        )
-
-    def create_alien_formation(self):
-        self.alien_list = arcade.SpriteList()
-        for row in range(ALIEN_ROWS):
-            for col in range(ALIENS_PER_ROW):
-                alien = Alien(":resources:images/enemies/bee.png", ALIEN_SCALE)
-                alien.center_x = col * (self.width / ALIENS_PER_ROW) + (
-                    self.width / (ALIENS_PER_ROW * 2)
-                )
-                alien.center_x += (row % 2) * ALIEN_HORIZONTAL_SPACING
-                alien.center_y = (
-                    SCREEN_HEIGHT
-                    + ALIEN_VERTICAL_SPACING
-                    + row * ALIEN_VERTICAL_SPACING
-                )
-                self.alien_list.append(alien)
+        if self.simulation is None:
+            if self.replay is not None:
+                self.simulation = self.replay.simulation()
+            else:
+                self.simulation = Simulation(self.width, self.height, self.tick_rate)
+            self.simulation.profiler = self.profiler
+            self.laser_sound = assets.sound(LASER_SOUND)
+            self.explosion_sound = assets.sound(EXPLOSION_SOUND)
+        else:
+            self.simulation.reset()
+        self.tick_accumulator = 0.0
+        if self.replay is not None:
+            self.replayer = Replayer(self.replay, self.simulation)
+            self.replayer.seek(self.replay_from)
+        elif self.record_path:
+            self.recorder = ReplayRecorder(self.simulation, self.seed)
+
+        if self.hud is None:
+            self.hud = Hud(self.width, self.height)
 
     def generate_stars(self):
-        num_stars = int((self.width * self.height) / 5000)
-        self.star_list = []
-        for _ in range(num_stars):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            size = random.uniform(1, 3)
-            speed = random.uniform(0.5, 2)
-            star = Star(x, y, size, speed)
-            self.star_list.append(star)
+        if self.starfield is None:
+            self.starfield = Starfield(
+                self.width, self.height, seed=self.seed, tick_rate=self.tick_rate
+            )
+            self.star_renderer = StarfieldRenderer(self.starfield, self.ctx)
+        else:
+            self.starfield.resize(self.width, self.height)
+
+    def interpolated_sprites(self):
+        simulation = self.simulation
+        return (simulation.ship_list, simulation.lasers, simulation.aliens)
+
+    def playing(self):
+        if self.replayer is not None:
+            return not self.replayer.finished
+        return not self.simulation.game_over
+
+    def inputs(self):
+        if self.replayer is not None:
+            return self.replayer.next_inputs()
+        return Inputs(self.left_pressed, self.right_pressed, self.ctrl_pressed)
 
     def on_draw(self):
+        profiler = self.profiler
+        profiler.mark()
         self.clear()
-        for star in self.star_list:
-            star.draw()
-        self.ship_list.draw()
-        self.lasers.draw()
-        self.alien_list.draw()
-        self.explosion_list.draw()
-
-        self.score_text = arcade.Text(
-            text=f"SCORE: {self.score}",
-            x=self.width - 200,
-            y=self.height - 30,
-            color=arcade.color.WHITE,
-            font_size=18,
-        )        
-        self.score_text.draw()
-        self.life_icon_list.draw()
-
-        if self.game_over:
-            self.game_over_text.draw()
-            self.enter_text.draw()
+        simulation = self.simulation
+        if simulation is None:
+            self.loading_screen.draw(self.preload.progress)
+            return
+        profiler.lap("draw clear")
+        # How far the display is between the last tick and the next one.
+        alpha = self.tick_accumulator / simulation.tick_time
+        self.star_renderer.draw(alpha)
+        profiler.lap("draw stars")
+        with self.interpolator.interpolated(self.interpolated_sprites(), alpha):
+            profiler.lap("interpolate")
+            simulation.ship_list.draw()
+            profiler.lap("draw ship")
+            simulation.lasers.draw()
+            profiler.lap("draw lasers")
+            simulation.aliens.draw()
+            profiler.lap("draw aliens")
+        profiler.lap("interpolate")
+        simulation.explosions.draw()
+        profiler.lap("draw explosions")
+
+        self.hud.update(simulation.score, simulation.lives, simulation.game_over)
+        self.hud.draw()
+        profiler.lap("draw hud")
+        if self.profiler_overlay is not None:
+            self.profiler_overlay.draw()
+            profiler.lap("draw profiler")
+        if self.startup_time is None:
+            self.startup_time = time.perf_counter() - self.started
+            if self.quit_when_started:
+                print(f"startup {self.startup_time:.3f} s")
+                self.close()
+
+    def load_remaining_assets(self):
+        if self.simulation is None:
+            if self.preload.ready(FIRST_FRAME_ASSETS):
+                self.setup()
+        elif self.preload.done:
+            self.preload.wait()  # raises if any load failed
+            self.preload = None
+            # Ahead of the first explosion, which would otherwise make them.
+            self.simulation.prepare_explosions()
 
     def on_update(self, delta_time):
-        if self.game_over:
+        profiler = self.profiler
+        profiler.frame()
+        if self.preload is not None:
+            self.load_remaining_assets()
+        simulation = self.simulation
+        if simulation is None:
+            return
+        self.starfield.apply_pending_resize(delta_time)
+        playing = self.playing()
+        self.power.set_idle(not playing)
+        if not playing:
             return
 
-        if self.player_exploding:
-            self.player_explosion_timer += 1
-            if self.player_explosion_timer > 60:  # 1 second explosion
-                self.player_exploding = False
-                self.player_explosion_timer = 0
-                self.reset_timer = 60  # 1 second delay before reset
-                return
-
-        if self.reset_timer > 0:
-            self.reset_timer -= 1
-            if self.reset_timer == 0:
-                self.reset_after_death()
-                return
-
-        for star in self.star_list:
-            star.update(self.height)
-
-        if self.left_pressed and not self.right_pressed:
-            self.ship_sprite.center_x -= SHIP_SPEED
-        elif self.right_pressed and not self.left_pressed:
-            self.ship_sprite.center_x += SHIP_SPEED
-
-        self.ship_sprite.center_x = max(
-            self.ship_sprite.width // 2,
-            min(self.ship_sprite.center_x, self.width - self.ship_sprite.width // 2),
-        )
-
-        self.lasers.update()
-        for sprite in self.lasers.get_active_sprites():
-            if sprite.bottom > self.height:
-                self.lasers.deactivate_sprite(sprite)
-
-        if self.ctrl_pressed:
-            self.fire_laser()
-
-        if time.time() - self.start_time > 2:  # Start alien movement after 2 seconds
-            self.alien_list.update(delta_time)
-
-        self.explosion_list.update(delta_time)
-
-        for laser in self.lasers.get_active_sprites():
-            hit_aliens = arcade.check_for_collision_with_list(laser, self.alien_list)
-            for alien in hit_aliens:
-                self.create_explosion(alien.center_x, alien.center_y)
-                alien.remove_from_sprite_lists()
-                self.score += 100
-                self.lasers.deactivate_sprite(laser)
-
-        for alien in self.alien_list:
-            if not self.player_exploding and arcade.check_for_collision(alien, self.ship_sprite):
-                self.lives -= 1
-                alien.remove_from_sprite_lists()
-                if self.lives <= 0:
-                    self.game_over = True
-                else:
-                    self.start_player_explosion()
-                if len(self.life_icon_list) > self.lives:
-                    self.life_icon_list.pop().remove_from_sprite_lists()
-
-    def fire_laser(self):
-        current_time = time.time()
-        if current_time - self.last_fire_time >= LASER_COOLDOWN:
-            laser = self.lasers.request_sprite()
-            if laser:
-                laser.reset(self.ship_sprite.center_x, self.ship_sprite.top)
-                arcade.play_sound(self.laser_sound)
-                self.last_fire_time = current_time
-
-    def start_player_explosion(self):
-        self.player_exploding = True
-        self.player_explosion_timer = 0
-        self.create_explosion(self.ship_sprite.center_x, self.ship_sprite.center_y)
-        self.ship_sprite.visible = False
-        
-    def create_explosion(self, x, y):
-        explosion = Explosion(self.explosion_textures)
-        explosion.center_x = x
-        explosion.center_y = y
-        self.explosion_list.append(explosion)
-        arcade.play_sound(self.explosion_sound)
-
-    def reset_after_death(self):
-        self.ship_sprite.center_x = self.width // 2
-        self.ship_sprite.center_y = self.ship_sprite.height
-        self.ship_sprite.visible = True
-        self.create_alien_formation()
-        self.lasers.deactivate_all()
+        tick_time = simulation.tick_time
+        self.tick_accumulator += delta_time
+        ticks = 0
+        while self.tick_accumulator >= tick_time and self.playing():
+            if ticks == MAX_CATCH_UP_TICKS:
+                # Too far behind to catch up: drop the backlog rather than
+                # spend ever longer frames simulating it.
+                self.tick_accumulator %= tick_time
+                break
+            self.interpolator.capture(self.interpolated_sprites())
+            profiler.lap("capture")
+            self.starfield.update()
+            profiler.lap("stars")
+            inputs = self.inputs()
+            profiler.lap("input")
+            # Laps its own phases: ship, lasers, aliens, explosions, collision.
+            simulation.step(inputs)
+            if self.recorder is not None:
+                self.recorder.record(inputs)
+            self.play_sounds(simulation.events)
+            profiler.lap("sounds")
+            self.tick_accumulator -= tick_time
+            ticks += 1
+        # Once per frame, so sounds from ticks run together are merged too.
+        self.mixer.flush()
+        profiler.lap("mixer")
+
+        if simulation.game_over:
+            self.save_recording()
+
+    def save_recording(self):
+        if self.recorder is not None:
+            self.recorder.save(self.record_path)
+            self.recorder = None
+
+    def play_sounds(self, events):
+        for event in events:
+            if event == LASER_FIRED:
+                self.mixer.trigger(self.laser_sound, SOUND_VOLUME)
+            elif event == EXPLOSION:
+                self.mixer.trigger(self.explosion_sound, SOUND_VOLUME)
+
+    def toggle_profiler_overlay(self):
+        if self.profiler_overlay is None:
+            self.profiler_overlay = ProfilerOverlay(
+                self.profiler, 10, self.height - 60, counters=self.overlay_counters
+            )
+            self.profiler.enable()
+        else:
+            self.profiler_overlay = None
+            if self.profile_path is None:
+                self.profiler.disable()
+
+    def overlay_counters(self):
+        counters = {**self.mixer.stats(), "power": self.power.state}
+        for state, usage in self.power.meter.usage().items():
+            counters[f"cpu {state}"] = f"{usage:.0%}"
+        return counters
 
     def on_key_press(self, key, modifiers):
-        if self.game_over and key == arcade.key.ENTER:
+        self.power.input()
+        if key == arcade.key.F3:
+            self.toggle_profiler_overlay()
+            return
+        if self.simulation is None:
+            return
+        if self.simulation.game_over and key == arcade.key.ENTER:
             self.setup()
             return
 
@@ -374,6 +308,7 @@ class GameWindow(arcade.Window):
             self.ctrl_pressed = True
 
     def on_key_release(self, key, modifiers):
+        self.power.input()
         if key == arcade.key.LEFT:
             self.left_pressed = False
         elif key == arcade.key.RIGHT:
@@ -381,17 +316,108 @@ class GameWindow(arcade.Window):
         elif key == arcade.key.LCTRL:
             self.ctrl_pressed = False
 
+    def on_mouse_motion(self, x, y, dx, dy):
+        self.power.input()
+
+    def on_mouse_press(self, x, y, button, modifiers):
+        self.power.input()
+
+    def on_activate(self):
+        self.power.set_focused(True)
+        self.power.input()
+
+    def on_deactivate(self):
+        self.power.set_focused(False)
+
+    def on_show(self):
+        self.power.set_minimized(False)
+        self.power.input()
+
+    def on_hide(self):
+        self.power.set_minimized(True)
+
     def on_resize(self, width, height):
         super().on_resize(width, height)
-        self.generate_stars()
-        if self.ship_sprite:
-            self.ship_sprite.center_x = self.width // 2
-            self.ship_sprite.center_y = self.ship_sprite.height
+        self.power.input()  # redraw at the new size straight away
+        if self.starfield is None:
+            self.generate_stars()
+        else:
+            self.starfield.request_resize(width, height)
+        if self.hud:
+            self.hud.resize(self.width, self.height)
+        if self.loading_screen:
+            self.loading_screen.resize(self.width, self.height)
+        if self.profiler_overlay:
+            self.profiler_overlay.set_position(10, self.height - 60)
+        if self.simulation and self.replayer is None:
+            self.simulation.resize(self.width, self.height)
+            if self.recorder is not None:
+                self.recorder.record_resize(self.width, self.height)
+
+    def on_close(self):
+        self.save_recording()
+        self.mixer.close()
+        if self.profile_path is not None:
+            self.profiler.export(self.profile_path)
+        if self.cpu_report:
+            print(self.power.meter.format())
+        super().on_close()
 
 
 def main():
-    window = GameWindow(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
-    window.setup()
+    started = time.perf_counter()
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    parser.add_argument("--seed", type=int, help="starfield seed")
+    parser.add_argument(
+        "--record", metavar="PATH", help="save each game's inputs here as it ends"
+    )
+    parser.add_argument("--replay", metavar="PATH", help="watch a recorded game")
+    parser.add_argument(
+        "--from-tick", type=int, default=0, help="where to start watching a replay"
+    )
+    parser.add_argument(
+        "--startup-time",
+        action="store_true",
+        help="print the time to the first frame of play and quit",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="profile every frame and write the timings here on exit"
+        " (.csv, .json, or .trace.json for chrome://tracing)",
+    )
+    parser.add_argument(
+        "--no-throttle",
+        dest="throttle",
+        action="store_false",
+        help="draw and update at full rate even when idle, unfocused or minimized",
+    )
+    parser.add_argument(
+        "--cpu-report",
+        action="store_true",
+        help="print the CPU use while active, idle, unfocused and minimized on exit",
+    )
+    args = parser.parse_args()
+
+    replay = Replay.load(args.replay) if args.replay else None
+    width, height = (
+        (replay.width, replay.height) if replay else (SCREEN_WIDTH, SCREEN_HEIGHT)
+    )
+    window = GameWindow(
+        width,
+        height,
+        SCREEN_TITLE,
+        seed=args.seed,
+        record_path=args.record,
+        replay=replay,
+        replay_from=args.from_tick,
+        started=started,
+        quit_when_started=args.startup_time,
+        profile_path=args.profile,
+        throttle=args.throttle,
+        cpu_report=args.cpu_report,
+    )
+    window.start()
     arcade.run()
 
 
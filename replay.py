@@ -0,0 +1,225 @@
+"""Record the inputs of a game and play them back tick for tick.
+
+A :class:`Simulation` only changes through the inputs it's stepped with and
+the playfield resizes it's told about, so a game is reproduced exactly by its
+starting size, tick rate, per-tick inputs and resizes. The starfield seed is
+kept too, so a rendered replay looks the same as well.
+
+The file is a fixed header followed by one zlib-compressed stream of LEB128
+varints: the number of input runs, each run as ``buttons, length``, then the
+number of resizes, each as ``tick, width, height``. Held buttons change a few
+times a second at most, so half an hour of play is a few kilobytes.
+"""
+
+import bisect
+import struct
+import zlib
+
+from simulation import Inputs, Simulation
+
+MAGIC = b"MMRP"
+VERSION = 1
+# magic, version, tick rate, width, height, starfield seed, ticks
+HEADER = struct.Struct("<4sBHHHQI")
+
+LEFT_BIT, RIGHT_BIT, FIRE_BIT = 1, 2, 4
+
+
+def pack_inputs(inputs):
+    return (
+        (LEFT_BIT if inputs.left else 0)
+        | (RIGHT_BIT if inputs.right else 0)
+        | (FIRE_BIT if inputs.fire else 0)
+    )
+
+
+def unpack_inputs(buttons):
+    return Inputs(
+        bool(buttons & LEFT_BIT), bool(buttons & RIGHT_BIT), bool(buttons & FIRE_BIT)
+    )
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varints(data):
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+    if shift:
+        raise ValueError("replay stream is truncated")
+
+
+class Replay:
+    """A recorded game: how to build its simulation, its inputs held as runs
+    of identical buttons, and the ticks the playfield was resized before."""
+
+    def __init__(self, tick_rate, width, height, seed):
+        self.tick_rate = tick_rate
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.runs = []  # [buttons, length] pairs
+        self.run_ends = []  # tick each run ends before, for seeking
+        self.resizes = []  # (tick, width, height)
+
+    def __len__(self):
+        return self.run_ends[-1] if self.run_ends else 0
+
+    def append(self, buttons, length=1):
+        if self.runs and self.runs[-1][0] == buttons:
+            self.runs[-1][1] += length
+            self.run_ends[-1] += length
+        else:
+            self.runs.append([buttons, length])
+            self.run_ends.append(len(self) + length)
+
+    def inputs_at(self, tick):
+        """The inputs the game was stepped with on tick ``tick`` (from 0)."""
+        if not 0 <= tick < len(self):
+            raise IndexError(tick)
+        return unpack_inputs(self.runs[bisect.bisect_right(self.run_ends, tick)][0])
+
+    def inputs(self, start=0):
+        """Every tick's inputs from tick ``start`` on."""
+        index = bisect.bisect_right(self.run_ends, start)
+        skip = start - (self.run_ends[index - 1] if index else 0)
+        for buttons, length in self.runs[index:]:
+            inputs = unpack_inputs(buttons)
+            for _ in range(length - skip):
+                yield inputs
+            skip = 0
+
+    def simulation(self):
+        return Simulation(self.width, self.height, self.tick_rate)
+
+    def to_bytes(self):
+        stream = bytearray()
+        _write_varint(stream, len(self.runs))
+        for buttons, length in self.runs:
+            _write_varint(stream, buttons)
+            _write_varint(stream, length)
+        _write_varint(stream, len(self.resizes))
+        for resize in self.resizes:
+            for value in resize:
+                _write_varint(stream, value)
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            self.tick_rate,
+            self.width,
+            self.height,
+            self.seed,
+            len(self),
+        )
+        return header + zlib.compress(bytes(stream), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, tick_rate, width, height, seed, ticks = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a replay file")
+        if version != VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        replay = cls(tick_rate, width, height, seed)
+        values = _read_varints(zlib.decompress(data[HEADER.size :]))
+        for _ in range(next(values)):
+            replay.append(next(values), next(values))
+        for _ in range(next(values)):
+            replay.resizes.append((next(values), next(values), next(values)))
+        if len(replay) != ticks:
+            raise ValueError(f"replay holds {len(replay)} ticks, header says {ticks}")
+        return replay
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class ReplayRecorder:
+    """Collects the inputs of every tick a simulation is stepped, and the
+    resizes between them."""
+
+    def __init__(self, simulation, seed=0):
+        self.replay = Replay(
+            simulation.tick_rate, simulation.width, simulation.height, seed
+        )
+
+    def record(self, inputs):
+        self.replay.append(pack_inputs(inputs))
+
+    def record_resize(self, width, height):
+        self.replay.resizes.append((len(self.replay), width, height))
+
+    def save(self, path):
+        self.replay.save(path)
+
+
+class Replayer:
+    """Steps a simulation through a replay's inputs and resizes."""
+
+    def __init__(self, replay, simulation=None):
+        self.replay = replay
+        self.simulation = simulation or replay.simulation()
+        self.restart()
+
+    @property
+    def tick(self):
+        return self.simulation.ticks
+
+    @property
+    def finished(self):
+        return self.tick >= len(self.replay) or self.simulation.game_over
+
+    def restart(self):
+        replay = self.replay
+        self.simulation.resize(replay.width, replay.height)
+        self.simulation.reset()
+        self._inputs = replay.inputs()
+        self._next_resize = 0
+
+    def next_inputs(self):
+        """The inputs for the next tick, applying any resize recorded before
+        it. Only valid while the replay isn't finished."""
+        resizes = self.replay.resizes
+        while (
+            self._next_resize < len(resizes)
+            and resizes[self._next_resize][0] <= self.tick
+        ):
+            _, width, height = resizes[self._next_resize]
+            self.simulation.resize(width, height)
+            self._next_resize += 1
+        return next(self._inputs)
+
+    def step(self):
+        """Play one recorded tick. Returns False when the replay is over."""
+        if self.finished:
+            return False
+        self.simulation.step(self.next_inputs())
+        return True
+
+    def seek(self, tick):
+        """Fast-forward, or restart and fast-forward, to just before ``tick``."""
+        tick = min(tick, len(self.replay))
+        if tick < self.tick:
+            self.restart()
+        while self.tick < tick and self.step():
+            pass
+
+    def run(self):
+        """Play the rest of the replay as fast as possible."""
+        self.seek(len(self.replay))
@@ -0,0 +1,492 @@
+import struct
+from pathlib import Path
+from typing import NamedTuple
+
+import arcade
+
+from arcadex.assets import assets
+from arcadex.collections import SpritePool
+from arcadex.collision import SpatialGrid, collide_batched
+from arcadex.profiler import FrameProfiler
+
+SCREEN_WIDTH = 1440
+SCREEN_HEIGHT = 1960
+
+# The simulation runs in fixed ticks, independent of the display's frame rate.
+TICK_RATE = 60  # ticks per second
+
+SHIP_SCALE = 1.0
+SHIP_SPEED = 600  # pixels per second
+LASER_SPEED = 1200  # pixels per second
+LASER_SCALE = 1.0
+ALIEN_SCALE = 0.8
+ALIEN_SPEED = 900  # pixels per second
+ALIEN_PATTERN_TIME = 2.0  # seconds between movement pattern switches
+ALIEN_START_DELAY = 2.0
+
+MAX_LASERS = 12
+LASER_COOLDOWN = 0.16
+
+EXPLOSION_FRAME_RATE = 60  # spritesheet frames per second
+PLAYER_EXPLOSION_TIME = 1.0
+RESET_DELAY = 1.0  # after the player's explosion, before the next life
+
+STARTING_LIVES = 3
+ALIEN_POINTS = 100
+
+ALIEN_ROWS = 4
+ALIENS_PER_ROW = 5
+ALIEN_HORIZONTAL_SPACING = 400
+ALIEN_VERTICAL_SPACING = SCREEN_HEIGHT * 2 / 3 / (ALIEN_ROWS - 1)
+
+SHIP_IMAGE = ":resources:images/space_shooter/playerShip1_orange.png"
+LASER_IMAGE = ":resources:images/space_shooter/laserBlue01.png"
+ALIEN_IMAGE = ":resources:images/enemies/bee.png"
+EXPLOSION_SPRITESHEET = ":resources:images/spritesheets/explosion.png"
+EXPLOSION_FRAME_SIZE = (256, 256)
+EXPLOSION_COLUMNS = 16
+EXPLOSION_FRAMES = 60
+
+# What a Simulation loads, as AssetCache.preload manifests. The first frame
+# only needs the sprites on screen; nothing explodes before the aliens arrive.
+FIRST_FRAME_ASSETS = [
+    ("texture", SHIP_IMAGE),
+    ("texture", LASER_IMAGE),
+    ("texture", ALIEN_IMAGE),
+]
+ASSETS = [
+    *FIRST_FRAME_ASSETS,
+    (
+        "grid",
+        EXPLOSION_SPRITESHEET,
+        EXPLOSION_FRAME_SIZE,
+        EXPLOSION_COLUMNS,
+        EXPLOSION_FRAMES,
+    ),
+]
+PREPARED_EXPLOSIONS = 4
+
+# All of the above textures packed into one file by build_atlas.py. Without
+# it they're loaded from their own files.
+ATLAS_PATH = Path(__file__).parent / "res" / "sprites.atlas"
+assets.use_atlas(ATLAS_PATH)
+
+# Snapshot layout: the game's scalars, then each pool's active and free
+# slots followed by one record per active sprite, in iteration order.
+_STATE = struct.Struct("<IdddiiI??IIdddd?")
+_POOL = struct.Struct("<HH")
+_LASER = struct.Struct("<dd")
+_ALIEN = struct.Struct("<dd?I")
+_EXPLOSION = struct.Struct("<ddIH?")
+
+# Sound events a tick can raise; see Simulation.events.
+LASER_FIRED = "laser"
+EXPLOSION = "explosion"
+
+
+def formation_positions(width):
+    """Where each alien of a fresh formation starts, row by row."""
+    positions = []
+    for row in range(ALIEN_ROWS):
+        for col in range(ALIENS_PER_ROW):
+            x = col * (width / ALIENS_PER_ROW) + (width / (ALIENS_PER_ROW * 2))
+            x += (row % 2) * ALIEN_HORIZONTAL_SPACING
+            y = SCREEN_HEIGHT + ALIEN_VERTICAL_SPACING + row * ALIEN_VERTICAL_SPACING
+            positions.append((x, y))
+    return positions
+
+
+class Laser(arcade.Sprite):
+    def __init__(self, texture, scale):
+        super().__init__(texture, scale)
+        self.angle = 270
+
+    def update(self, delta_time):
+        # Only called on lasers active in their pool.
+        self.center_y += LASER_SPEED * delta_time
+
+    def reset(self, x, y):
+        self.center_x = x
+        self.center_y = y
+
+
+class Explosion(arcade.Sprite):
+    def __init__(self, texture_list):
+        super().__init__()
+        self.current_texture = 0
+        self.textures = texture_list
+        self.scale = 1.0
+        self.ticks = 0
+        self.finished = False
+        self.set_texture(self.current_texture)
+
+    def update(self, delta_time):
+        self.ticks += 1
+        self.current_texture = int(self.ticks * (EXPLOSION_FRAME_RATE * delta_time))
+        if self.current_texture < len(self.textures):
+            self.set_texture(self.current_texture)
+        else:
+            self.finished = True
+
+    def reset(self, x, y):
+        self.center_x = x
+        self.center_y = y
+        self.current_texture = 0
+        self.ticks = 0
+        self.finished = False
+        self.set_texture(self.current_texture)
+
+
+class Alien(arcade.Sprite):
+    def __init__(self, texture, scale):
+        super().__init__(texture, scale)
+        self.movement_pattern = "diagonal_down"
+        self.pattern_timer = 0
+
+    def reset(self, x, y):
+        self.center_x = x
+        self.center_y = y
+        self.movement_pattern = "diagonal_down"
+        self.pattern_timer = 0
+
+    def update(self, delta_time: float = 1 / 60):
+        movement_speed = ALIEN_SPEED * delta_time
+
+        if self.movement_pattern == "diagonal_down":
+            self.center_x += movement_speed / 2
+            self.center_y -= movement_speed
+        elif self.movement_pattern == "right":
+            self.center_x += movement_speed
+
+        self.pattern_timer += 1
+        if self.pattern_timer >= round(ALIEN_PATTERN_TIME / delta_time):
+            self.pattern_timer = 0
+            if self.movement_pattern == "diagonal_down":
+                self.movement_pattern = "right"
+            else:
+                self.movement_pattern = "diagonal_down"
+
+        # Wrap around screen edges
+        if self.right < 0:
+            self.left = SCREEN_WIDTH
+        elif self.left > SCREEN_WIDTH:
+            self.right = 0
+        if self.top < 0:
+            self.bottom = SCREEN_HEIGHT
+
+
+class Inputs(NamedTuple):
+    """The controls held down during one tick."""
+
+    left: bool = False
+    right: bool = False
+    fire: bool = False
+
+
+NO_INPUT = Inputs()
+
+
+class Simulation:
+    """The game's rules and state, stepped one fixed tick at a time.
+
+    Nothing here needs a window or an OpenGL context: sprites are only used
+    for their positions and hit boxes, and sounds are reported through
+    ``events`` for whoever is presenting the game to play. Textures and pools
+    are created once; :meth:`reset` starts a new game with them.
+    """
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, tick_rate=TICK_RATE):
+        self.width = width
+        self.height = height
+        self.tick_rate = tick_rate
+        self.tick_time = 1 / tick_rate
+
+        # Textures come from the process-wide cache, so another Simulation
+        # (or a restart) never loads or decodes them again.
+        self.ship_sprite = arcade.Sprite(assets.texture(SHIP_IMAGE), SHIP_SCALE)
+        self.ship_list = arcade.SpriteList()
+        self.ship_list.append(self.ship_sprite)
+        self.lasers = SpritePool(
+            [Laser(assets.texture(LASER_IMAGE), LASER_SCALE) for _ in range(MAX_LASERS)]
+        )
+        self.aliens = SpritePool(
+            factory=lambda: Alien(assets.texture(ALIEN_IMAGE), ALIEN_SCALE),
+            initial_size=ALIEN_ROWS * ALIENS_PER_ROW,
+        )
+        self.alien_grid = SpatialGrid(cell_size=128)
+
+        # Explosions are made when first needed, or by prepare_explosions(),
+        # so a game can start while the spritesheet is still being decoded.
+        self.explosions = SpritePool(factory=lambda: Explosion(self.explosion_textures))
+
+        # Sounds raised by the latest step, cleared at the start of the next.
+        self.events = []
+        # Timed per phase of each tick when whoever steps the game enables it.
+        self.profiler = FrameProfiler(capacity=1)
+        self.reset()
+
+    @property
+    def explosion_textures(self):
+        return assets.texture_grid(
+            EXPLOSION_SPRITESHEET,
+            size=EXPLOSION_FRAME_SIZE,
+            columns=EXPLOSION_COLUMNS,
+            count=EXPLOSION_FRAMES,
+        )
+
+    def prepare_explosions(self, count=PREPARED_EXPLOSIONS):
+        """Create the first ``count`` explosion sprites ahead of time."""
+        self.explosions.reserve(count)
+
+    def reset(self):
+        self.ticks = 0
+        self.sim_time = 0.0
+        self.start_time = self.sim_time
+        self.last_fire_time = self.sim_time - LASER_COOLDOWN
+        self.score = 0
+        self.lives = STARTING_LIVES
+        self.aliens_killed = 0
+        self.game_over = False
+        self.player_exploding = False
+        self.player_explosion_timer = 0
+        self.reset_timer = 0
+        self.events.clear()
+        self.center_ship()
+        self.ship_sprite.visible = True
+        # Back to the slot order of new pools, so the game (and its
+        # snapshots) doesn't depend on the games played before it.
+        self.lasers.reset_slots()
+        self.explosions.reset_slots()
+        self.aliens.reset_slots()
+        self.create_alien_formation()
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+        self.center_ship()
+
+    def center_ship(self):
+        self.ship_sprite.center_x = self.width // 2
+        self.ship_sprite.center_y = self.ship_sprite.height
+
+    def create_alien_formation(self):
+        self.aliens.deactivate_all()
+        for x, y in formation_positions(self.width):
+            self.aliens.request_sprite().reset(x, y)
+
+    def snapshot(self):
+        """Everything that decides how the game plays on, as a compact
+        ``bytes`` for :meth:`restore`."""
+        ship = self.ship_sprite
+        data = bytearray(
+            _STATE.pack(
+                self.ticks,
+                self.sim_time,
+                self.start_time,
+                self.last_fire_time,
+                self.score,
+                self.lives,
+                self.aliens_killed,
+                self.game_over,
+                self.player_exploding,
+                self.player_explosion_timer,
+                self.reset_timer,
+                self.width,
+                self.height,
+                ship.center_x,
+                ship.center_y,
+                ship.visible,
+            )
+        )
+        _pack_pool(data, self.lasers, _LASER, lambda laser: laser.position)
+        _pack_pool(
+            data,
+            self.aliens,
+            _ALIEN,
+            lambda alien: (
+                *alien.position,
+                alien.movement_pattern == "diagonal_down",
+                alien.pattern_timer,
+            ),
+        )
+        _pack_pool(
+            data,
+            self.explosions,
+            _EXPLOSION,
+            lambda explosion: (
+                *explosion.position,
+                explosion.ticks,
+                explosion.current_texture,
+                explosion.finished,
+            ),
+        )
+        return bytes(data)
+
+    def restore(self, data):
+        """Return to the moment :meth:`snapshot` produced ``data``, reusing
+        the existing sprites."""
+        (
+            self.ticks,
+            self.sim_time,
+            self.start_time,
+            self.last_fire_time,
+            self.score,
+            self.lives,
+            self.aliens_killed,
+            self.game_over,
+            self.player_exploding,
+            self.player_explosion_timer,
+            self.reset_timer,
+            self.width,
+            self.height,
+            ship_x,
+            ship_y,
+            ship_visible,
+        ) = _STATE.unpack_from(data)
+        ship = self.ship_sprite
+        ship.position = (ship_x, ship_y)
+        ship.visible = ship_visible
+        self.events.clear()
+
+        lasers, offset = _unpack_pool(data, _STATE.size, self.lasers, _LASER)
+        for laser, position in lasers:
+            laser.position = position
+        aliens, offset = _unpack_pool(data, offset, self.aliens, _ALIEN)
+        for alien, (x, y, diagonal, timer) in aliens:
+            alien.position = (x, y)
+            alien.movement_pattern = "diagonal_down" if diagonal else "right"
+            alien.pattern_timer = timer
+        explosions, _ = _unpack_pool(data, offset, self.explosions, _EXPLOSION)
+        textures = len(self.explosion_textures)
+        for explosion, (x, y, ticks, frame, finished) in explosions:
+            explosion.position = (x, y)
+            explosion.ticks = ticks
+            explosion.finished = finished
+            explosion.current_texture = frame
+            explosion.set_texture(min(frame, textures - 1))
+
+    def ticks_for(self, seconds):
+        return round(seconds * self.tick_rate)
+
+    def step(self, inputs=NO_INPUT):
+        """Advance the game by one tick. Returns False once the game is over."""
+        self.events.clear()
+        if self.game_over:
+            return False
+        self.ticks += 1
+        self.tick(inputs, self.tick_time)
+        return not self.game_over
+
+    def tick(self, inputs, delta_time):
+        profiler = self.profiler
+        self.sim_time += delta_time
+
+        if self.player_exploding:
+            self.player_explosion_timer += 1
+            if self.player_explosion_timer > self.ticks_for(PLAYER_EXPLOSION_TIME):
+                self.player_exploding = False
+                self.player_explosion_timer = 0
+                self.reset_timer = self.ticks_for(RESET_DELAY)
+                return
+
+        if self.reset_timer > 0:
+            self.reset_timer -= 1
+            if self.reset_timer == 0:
+                self.reset_after_death()
+                return
+
+        if inputs.left and not inputs.right:
+            self.ship_sprite.center_x -= SHIP_SPEED * delta_time
+        elif inputs.right and not inputs.left:
+            self.ship_sprite.center_x += SHIP_SPEED * delta_time
+
+        self.ship_sprite.center_x = max(
+            self.ship_sprite.width // 2,
+            min(self.ship_sprite.center_x, self.width - self.ship_sprite.width // 2),
+        )
+        profiler.lap("ship")
+
+        self.lasers.update(delta_time)
+        for sprite in self.lasers:
+            if sprite.bottom > self.height:
+                self.lasers.deactivate_sprite(sprite)
+
+        if inputs.fire:
+            self.fire_laser()
+        profiler.lap("lasers")
+
+        if self.sim_time - self.start_time > ALIEN_START_DELAY:
+            self.aliens.update(delta_time)
+        profiler.lap("aliens")
+
+        self.explosions.update(delta_time)
+        for explosion in self.explosions:
+            if explosion.finished:
+                self.explosions.deactivate_sprite(explosion)
+        profiler.lap("explosions")
+
+        for laser, alien in collide_batched(self.lasers.active, self.aliens.active):
+            if alien not in self.aliens:
+                continue  # Already shot down by an earlier laser this tick
+            self.create_explosion(alien.center_x, alien.center_y)
+            self.aliens.deactivate_sprite(alien)
+            self.score += ALIEN_POINTS
+            self.aliens_killed += 1
+            self.lasers.deactivate_sprite(laser)
+
+        self.alien_grid.rebuild(self.aliens)
+        for alien in self.alien_grid.collisions(self.ship_sprite):
+            if not self.player_exploding and alien in self.aliens:
+                self.lives -= 1
+                self.aliens.deactivate_sprite(alien)
+                if self.lives <= 0:
+                    self.game_over = True
+                else:
+                    self.start_player_explosion()
+        profiler.lap("collision")
+
+    def fire_laser(self):
+        current_time = self.sim_time
+        if current_time - self.last_fire_time >= LASER_COOLDOWN:
+            laser = self.lasers.request_sprite()
+            if laser:
+                laser.reset(self.ship_sprite.center_x, self.ship_sprite.top)
+                self.events.append(LASER_FIRED)
+                self.last_fire_time = current_time
+
+    def start_player_explosion(self):
+        self.player_exploding = True
+        self.player_explosion_timer = 0
+        self.create_explosion(self.ship_sprite.center_x, self.ship_sprite.center_y)
+        self.ship_sprite.visible = False
+
+    def create_explosion(self, x, y):
+        explosion = self.explosions.request_sprite()
+        explosion.reset(x, y)
+        self.events.append(EXPLOSION)
+
+    def reset_after_death(self):
+        self.center_ship()
+        self.ship_sprite.visible = True
+        self.create_alien_formation()
+        self.lasers.deactivate_all()
+
+
+def _pack_pool(data, pool, record, fields):
+    active, free = pool.state()
+    data += _POOL.pack(len(active), len(free))
+    data += struct.pack(f"<{len(active) + len(free)}H", *active, *free)
+    for sprite in pool.active:
+        data += record.pack(*fields(sprite))
+
+
+def _unpack_pool(data, offset, pool, record):
+    """Restore ``pool``'s slots from ``data``. Returns each active sprite
+    paired with its record, and the offset just past the pool."""
+    active_count, free_count = _POOL.unpack_from(data, offset)
+    offset += _POOL.size
+    slots = struct.unpack_from(f"<{active_count + free_count}H", data, offset)
+    offset += 2 * len(slots)
+    pool.restore_state(slots[:active_count], slots[active_count:])
+    end = offset + record.size * active_count
+    return zip(pool.active, record.iter_unpack(data[offset:end])), end
@@ -0,0 +1,338 @@
+import arcade
+import numpy as np
+
+from arcadex.assets import assets
+from simulation import (
+    ALIEN_IMAGE,
+    ALIEN_PATTERN_TIME,
+    ALIEN_POINTS,
+    ALIEN_ROWS,
+    ALIEN_SCALE,
+    ALIEN_SPEED,
+    ALIEN_START_DELAY,
+    ALIENS_PER_ROW,
+    LASER_COOLDOWN,
+    LASER_IMAGE,
+    LASER_SCALE,
+    LASER_SPEED,
+    MAX_LASERS,
+    PLAYER_EXPLOSION_TIME,
+    RESET_DELAY,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    SHIP_IMAGE,
+    SHIP_SCALE,
+    SHIP_SPEED,
+    STARTING_LIVES,
+    TICK_RATE,
+    Laser,
+    formation_positions,
+)
+
+ALIENS = ALIEN_ROWS * ALIENS_PER_ROW
+# Columns of the actions array passed to VectorEnv.step.
+LEFT, RIGHT, FIRE = range(3)
+# Ship x, lives and "exploding", then x, y and "active" for every alien and
+# every laser slot.
+OBSERVATION_SIZE = 3 + 3 * ALIENS + 3 * MAX_LASERS
+
+
+def _hit_box(sprite):
+    sprite.position = (0, 0)
+    return np.array(sprite.hit_box.get_adjusted_points())
+
+
+def _convex_hull(points):
+    # Andrew's monotone chain; returns the hull counter-clockwise.
+    points = sorted(set(map(tuple, points)))
+
+    def half(points):
+        hull = []
+        for p in points:
+            while (
+                len(hull) >= 2
+                and (
+                    (hull[-1][0] - hull[-2][0]) * (p[1] - hull[-2][1])
+                    - (hull[-1][1] - hull[-2][1]) * (p[0] - hull[-2][0])
+                )
+                <= 0
+            ):
+                hull.pop()
+            hull.append(p)
+        return hull[:-1]
+
+    return np.array(half(points) + half(points[::-1]))
+
+
+class _Contact:
+    """Exact hit box overlap between two kinds of sprite, for any number of
+    pairs at once.
+
+    Hit boxes here never rotate or scale after creation, so a sprite with hit
+    box A at ``p1`` touches one with hit box B at ``p2`` exactly when
+    ``p1 - p2`` lies inside the convex polygon B - A (their Minkowski
+    difference). That polygon is built once; a pair then costs a bounds
+    check and, for the few pairs that pass, one dot product per edge.
+    """
+
+    def __init__(self, sprite, other):
+        points = _hit_box(sprite)
+        other_points = _hit_box(other)
+        hull = _convex_hull(
+            (other_points[None, :, :] - points[:, None, :]).reshape(-1, 2)
+        )
+        self.left, self.bottom = hull.min(axis=0)
+        self.right, self.top = hull.max(axis=0)
+        # Outward edge normals (nx, ny) and offsets c: inside when
+        # nx * dx + ny * dy <= c for every edge.
+        edges = np.roll(hull, -1, axis=0) - hull
+        normals = np.stack([edges[:, 1], -edges[:, 0]], axis=1)
+        self.planes = [
+            (nx, ny, c) for (nx, ny), c in zip(normals, (normals * hull).sum(axis=1))
+        ]
+
+    def overlaps(self, candidates, dx, dy):
+        """Narrow the boolean array ``candidates`` down to the pairs whose
+        center offsets ``dx, dy`` put their hit boxes in contact."""
+        candidates = (
+            candidates
+            & (dx >= self.left)
+            & (dx <= self.right)
+            & (dy >= self.bottom)
+            & (dy <= self.top)
+        )
+        pairs = np.nonzero(candidates)
+        if not len(pairs[0]):
+            return candidates
+        px = dx[pairs]
+        py = dy[pairs]
+        inside = np.ones(len(px), bool)
+        for nx, ny, c in self.planes:
+            inside &= nx * px + ny * py <= c
+        candidates[pairs] = inside
+        return candidates
+
+
+class VectorEnv:
+    """``num_envs`` games of :class:`simulation.Simulation` stepped in lockstep.
+
+    Each piece of game state is one array with a row per game, so a tick of
+    every game is a fixed number of NumPy operations however many games there
+    are. The rules, their order and the hit boxes match ``Simulation.tick``.
+
+    Games that end are started over inside :meth:`step`, gym-style; the
+    score they finished with is left in ``final_scores``.
+    """
+
+    def __init__(
+        self, num_envs, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, tick_rate=TICK_RATE
+    ):
+        self.num_envs = num_envs
+        self.width = width
+        self.height = height
+        self.tick_time = 1 / tick_rate
+        self.explosion_ticks = round(PLAYER_EXPLOSION_TIME * tick_rate)
+        self.reset_ticks = round(RESET_DELAY * tick_rate)
+        self.pattern_ticks = round(ALIEN_PATTERN_TIME / self.tick_time)
+
+        ship = arcade.Sprite(assets.texture(SHIP_IMAGE), SHIP_SCALE)
+        laser = Laser(assets.texture(LASER_IMAGE), LASER_SCALE)
+        alien = arcade.Sprite(assets.texture(ALIEN_IMAGE), ALIEN_SCALE)
+        self.laser_contact = _Contact(laser, alien)
+        self.ship_contact = _Contact(ship, alien)
+        # _Contact left the sprites at the origin, so their hit box edges are
+        # offsets from the center.
+        self.half_ship = ship.width // 2
+        self.ship_y = ship.height
+        self.laser_start_y = self.ship_y + ship.top
+        self.laser_bottom = laser.bottom
+        self.alien_edges = (alien.left, alien.right, alien.bottom, alien.top)
+        formation = np.array(formation_positions(width))
+        self.formation_x = formation[:, 0]
+        self.formation_y = formation[:, 1]
+
+        n = num_envs
+        self.sim_time = np.zeros(n)
+        self.last_fire_time = np.zeros(n)
+        self.score = np.zeros(n, np.int64)
+        self.final_scores = np.zeros(n, np.int64)
+        self.lives = np.zeros(n, np.int64)
+        self.game_over = np.zeros(n, bool)
+        self.player_exploding = np.zeros(n, bool)
+        self.player_explosion_timer = np.zeros(n, np.int64)
+        self.reset_timer = np.zeros(n, np.int64)
+        self.ship_x = np.zeros(n)
+        self.laser_x = np.zeros((n, MAX_LASERS))
+        self.laser_y = np.zeros((n, MAX_LASERS))
+        self.laser_active = np.zeros((n, MAX_LASERS), bool)
+        self.alien_x = np.zeros((n, ALIENS))
+        self.alien_y = np.zeros((n, ALIENS))
+        self.alien_active = np.zeros((n, ALIENS), bool)
+        # Every alien in a game was placed by the same formation reset and
+        # moves on the same ticks, so they share one pattern and timer.
+        self.diagonal = np.zeros(n, bool)
+        self.pattern_timer = np.zeros(n, np.int64)
+
+    def reset(self, games=None):
+        """Start new games in the rows selected by ``games`` (a boolean mask
+        or index array; every game by default) and return the observations."""
+        if games is None:
+            games = slice(None)
+        self.sim_time[games] = 0.0
+        self.last_fire_time[games] = -LASER_COOLDOWN
+        self.score[games] = 0
+        self.lives[games] = STARTING_LIVES
+        self.game_over[games] = False
+        self.player_exploding[games] = False
+        self.player_explosion_timer[games] = 0
+        self.reset_timer[games] = 0
+        self._reset_after_death(games)
+        return self.observations()
+
+    def _reset_after_death(self, games):
+        self.ship_x[games] = self.width // 2
+        self.laser_active[games] = False
+        self.alien_x[games] = self.formation_x
+        self.alien_y[games] = self.formation_y
+        self.alien_active[games] = True
+        self.diagonal[games] = True
+        self.pattern_timer[games] = 0
+
+    def observations(self):
+        width, height = self.width, self.height
+        return np.concatenate(
+            [
+                (self.ship_x / width)[:, None],
+                self.lives[:, None],
+                self.player_exploding[:, None],
+                self.alien_x / width,
+                self.alien_y / height,
+                self.alien_active,
+                self.laser_x / width,
+                self.laser_y / height,
+                self.laser_active,
+            ],
+            axis=1,
+            dtype=np.float32,
+        )
+
+    def step(self, actions):
+        """Advance every game one tick.
+
+        ``actions`` is a ``(num_envs, 3)`` array of held LEFT, RIGHT and FIRE
+        buttons. Returns the observations, the points each game scored this
+        tick, and which games ended (and have been started over).
+        """
+        actions = np.asarray(actions, dtype=bool)
+        left = actions[:, LEFT]
+        right = actions[:, RIGHT]
+        fire = actions[:, FIRE]
+        dt = self.tick_time
+        score_before = self.score.copy()
+
+        self.sim_time += dt
+
+        # The player's explosion, then the pause before the next life; both
+        # end their tick early on the tick they finish.
+        exploding = self.player_exploding
+        self.player_explosion_timer[exploding] += 1
+        exploded = exploding & (self.player_explosion_timer > self.explosion_ticks)
+        self.player_exploding[exploded] = False
+        self.player_explosion_timer[exploded] = 0
+        self.reset_timer[exploded] = self.reset_ticks
+        waiting = ~exploded & (self.reset_timer > 0)
+        self.reset_timer[waiting] -= 1
+        revived = waiting & (self.reset_timer == 0)
+        self._reset_after_death(revived)
+        live = ~(exploded | revived)
+
+        speed = SHIP_SPEED * dt
+        self.ship_x[live & left & ~right] -= speed
+        self.ship_x[live & right & ~left] += speed
+        half_ship = self.half_ship
+        self.ship_x[live] = np.clip(
+            self.ship_x[live], half_ship, self.width - half_ship
+        )
+
+        lasers = self.laser_active
+        flying = live[:, None] & lasers
+        self.laser_y[flying] += LASER_SPEED * dt
+        lasers[flying & (self.laser_y + self.laser_bottom > self.height)] = False
+
+        free = ~lasers
+        firing = (
+            live
+            & fire
+            & (self.sim_time - self.last_fire_time >= LASER_COOLDOWN)
+            & free.any(axis=1)
+        )
+        games = np.flatnonzero(firing)
+        slots = free[games].argmax(axis=1)
+        lasers[games, slots] = True
+        self.laser_x[games, slots] = self.ship_x[games]
+        self.laser_y[games, slots] = self.laser_start_y
+        self.last_fire_time[games] = self.sim_time[games]
+
+        self._move_aliens(live & (self.sim_time > ALIEN_START_DELAY), dt)
+
+        # Lasers against aliens. Each alien goes to the first laser touching
+        # it, and a laser is spent if any alien was credited to it.
+        aliens = self.alien_active
+        hits = self.laser_contact.overlaps(
+            live[:, None, None] & lasers[:, :, None] & aliens[:, None, :],
+            self.laser_x[:, :, None] - self.alien_x[:, None, :],
+            self.laser_y[:, :, None] - self.alien_y[:, None, :],
+        )
+        shot = hits.any(axis=1)
+        shooters = hits.argmax(axis=1)
+        games, shot_aliens = np.nonzero(shot)
+        lasers[games, shooters[games, shot_aliens]] = False
+        aliens[shot] = False
+        self.score += ALIEN_POINTS * shot.sum(axis=1)
+
+        # The ship against what's left; the first alien to touch it costs a
+        # life and is destroyed.
+        touching = self.ship_contact.overlaps(
+            (live & ~self.player_exploding)[:, None] & aliens,
+            self.ship_x[:, None] - self.alien_x,
+            self.ship_y - self.alien_y,
+        )
+        crashed = touching.any(axis=1)
+        games = np.flatnonzero(crashed)
+        aliens[games, touching[games].argmax(axis=1)] = False
+        self.lives[crashed] -= 1
+        over = crashed & (self.lives <= 0)
+        self.game_over |= over
+        dying = crashed & ~over
+        self.player_exploding[dying] = True
+        self.player_explosion_timer[dying] = 0
+
+        rewards = (self.score - score_before).astype(np.float32)
+        dones = self.game_over.copy()
+        if dones.any():
+            self.final_scores[dones] = self.score[dones]
+            self.reset(dones)
+        return self.observations(), rewards, dones
+
+    def _move_aliens(self, moving, dt):
+        speed = ALIEN_SPEED * dt
+        diagonal = (moving & self.diagonal)[:, None]
+        across = (moving & ~self.diagonal)[:, None]
+        x, y = self.alien_x, self.alien_y
+        x += np.where(diagonal, speed / 2, np.where(across, speed, 0.0))
+        y -= np.where(diagonal, speed, 0.0)
+
+        self.pattern_timer[moving] += 1
+        switching = moving & (self.pattern_timer >= self.pattern_ticks)
+        self.pattern_timer[switching] = 0
+        self.diagonal[switching] = ~self.diagonal[switching]
+
+        # Wrap around screen edges
+        left, right, bottom, top = self.alien_edges
+        moved = moving[:, None]
+        off_left = moved & (x + right < 0)
+        off_right = moved & ~off_left & (x + left > SCREEN_WIDTH)
+        below = moved & (y + top < 0)
+        x[off_left] = SCREEN_WIDTH - left
+        x[off_right] = -right
+        y[below] = SCREEN_HEIGHT - bottom